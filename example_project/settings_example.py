@@ -39,7 +39,10 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 
                 # Optional: Add meme maker context processor to have
-                # meme maker settings available in all templates
+                # meme maker settings available in all templates.
+                # Django imports these paths once per template engine, and
+                # the meme maker processor reuses one prebuilt dict, so it
+                # adds no per-request import or settings cost.
                 'meme_maker.context_processors.meme_maker_context',
             ],
         },
@@ -132,3 +135,38 @@ MEME_MAKER = {
 # AWS_S3_CUSTOM_DOMAIN = f'{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com'
 # AWS_DEFAULT_ACL = 'public-read'
 
+
+# =============================================================================
+# EXAMPLE: Serving Media in Production (nginx)
+# =============================================================================
+# Meme images are large binaries. In production, let nginx serve MEDIA_ROOT
+# directly instead of routing every image request through a Django worker:
+#
+# location /media/ {
+#     alias /path/to/media/;
+#     sendfile on;
+#     tcp_nopush on;
+#     # Uploaded and generated files get unique names, so they can be
+#     # cached aggressively by browsers and CDNs (admin previews included)
+#     expires 30d;
+#     add_header Cache-Control "public, immutable";
+# }
+#
+# If some media must stay behind a permission check, mark an internal
+# location and let a Django view hand the transfer off to nginx with
+# X-Accel-Redirect:
+#
+# location /protected-media/ {
+#     internal;
+#     alias /path/to/media/;
+# }
+#
+# # views.py
+# from django.http import HttpResponse
+#
+# def protected_media(request, path):
+#     # ... check permissions ...
+#     response = HttpResponse()
+#     response['X-Accel-Redirect'] = f'/protected-media/{path}'
+#     response['Content-Type'] = ''  # let nginx set it from the file
+#     return response
@@ -29,6 +29,7 @@ urlpatterns = [
 
 # Serve media files in development
 # In production, configure your web server (nginx, Apache) to serve media files
+# (see the nginx / X-Accel-Redirect example in settings_example.py)
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
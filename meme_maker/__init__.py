@@ -35,25 +35,25 @@ def get_version():
 
 # Lazy imports to avoid AppRegistryNotReady errors
 # These are only imported when accessed, after Django is fully loaded
+_LAZY_ATTRS = {
+    'Meme': ('.models', 'Meme'),
+    'MemeTemplate': ('.models', 'MemeTemplate'),
+    'MemeTemplateForm': ('.forms', 'MemeTemplateForm'),
+    'MemeEditorForm': ('.forms', 'MemeEditorForm'),
+    'meme_maker_settings': ('.conf', 'meme_maker_settings'),
+}
+
 
 def __getattr__(name):
     """Lazy import of models and forms to avoid AppRegistryNotReady errors."""
-    if name == 'Meme':
-        from .models import Meme
-        return Meme
-    elif name == 'MemeTemplate':
-        from .models import MemeTemplate
-        return MemeTemplate
-    elif name == 'MemeTemplateForm':
-        from .forms import MemeTemplateForm
-        return MemeTemplateForm
-    elif name == 'MemeEditorForm':
-        from .forms import MemeEditorForm
-        return MemeEditorForm
-    elif name == 'meme_maker_settings':
-        from .conf import meme_maker_settings
-        return meme_maker_settings
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    spec = _LAZY_ATTRS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(spec[0], __name__), spec[1])
+    # Cache on the module so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -4,9 +4,88 @@ Admin configuration for django-meme-maker.
 Provides admin interfaces for MemeTemplate, Meme, and Link models.
 """
 
+import functools
+import json
+import time
+from html import escape
+
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
 from django.utils.html import format_html
-from .models import MemeTemplate, Meme, TemplateLink, MemeLink, TemplateFlag, MemeFlag, ExternalSourceQuery
+from django.utils.safestring import mark_safe
+from .models import (
+    MemeTemplate, Meme, TemplateLink, MemeLink, TemplateFlag, MemeFlag, ExternalSourceQuery,
+    delete_stored_file, meme_upload_path,
+)
+
+
+# Preview markup is formatted with str.format on an escaped URL rather than
+# format_html, which re-parses the format string on every row. The stdlib
+# html.escape is used directly; Django's escape wraps the same call in
+# keep_lazy and an extra SafeString per value.
+# Previews load lazily so long changelists only fetch the rows on screen.
+_THUMBNAIL_PREVIEW_HTML = (
+    '<img src="{}" loading="lazy" decoding="async" '
+    'style="max-height: 50px; max-width: 80px; object-fit: cover; border-radius: 4px;">'
+)
+_TEMPLATE_PREVIEW_HTML = (
+    '<img src="{}" loading="lazy" decoding="async" '
+    'style="max-height: 300px; max-width: 100%; object-fit: contain; border-radius: 8px;">'
+)
+_MEME_PREVIEW_HTML = (
+    '<img src="{}" loading="lazy" decoding="async" '
+    'style="max-height: 400px; max-width: 100%; object-fit: contain; border-radius: 8px;">'
+)
+
+
+def _render_preview(url, template):
+    """Fill a preview template with the escaped URL, or '-' without an image."""
+    if not url:
+        return '-'
+    return mark_safe(template.format(escape(url)))
+
+
+class PopularTemplateFilter(admin.SimpleListFilter):
+    """
+    Filter memes by template, listing only the most-used templates.
+    
+    The default FK filter loads every template into the sidebar. Any template
+    can still be filtered by passing its pk as ?template=<pk>.
+    
+    Ranking templates counts the whole memes table, so the result is kept
+    for cache_seconds rather than recomputed on every changelist load.
+    """
+    title = 'template'
+    parameter_name = 'template'
+    limit = 10
+    cache_seconds = 300
+    
+    # limit -> (expiry on the time.monotonic() clock, lookups)
+    _lookups_cache = {}
+    
+    def lookups(self, request, model_admin):
+        cached = self._lookups_cache.get(self.limit)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        templates = MemeTemplate.objects.annotate(
+            num_memes=Count('memes')
+        ).order_by('-num_memes').values_list('pk', 'title')[:self.limit]
+        lookups = [(str(pk), title) for pk, title in templates]
+        self._lookups_cache[self.limit] = (time.monotonic() + self.cache_seconds, lookups)
+        return lookups
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            try:
+                return queryset.filter(template_id=self.value())
+            except (ValueError, ValidationError) as e:
+                raise IncorrectLookupParameters(e)
+        return queryset
 
 
 @admin.register(MemeTemplate)
@@ -34,28 +113,23 @@ class MemeTemplateAdmin(admin.ModelAdmin):
     
     def image_preview(self, obj):
         """Show a small image preview in the list."""
-        if obj.image:
-            return format_html(
-                '<img src="{}" style="max-height: 50px; max-width: 80px; object-fit: cover; border-radius: 4px;">',
-                obj.image.url
-            )
-        return '-'
+        return _render_preview(obj.image and obj.image.url, _THUMBNAIL_PREVIEW_HTML)
     image_preview.short_description = 'Preview'
     
     def image_preview_large(self, obj):
         """Show a larger image preview in the detail view."""
-        if obj.image:
-            return format_html(
-                '<img src="{}" style="max-height: 300px; max-width: 100%; object-fit: contain; border-radius: 8px;">',
-                obj.image.url
-            )
-        return '-'
+        return _render_preview(obj.image and obj.image.url, _TEMPLATE_PREVIEW_HTML)
     image_preview_large.short_description = 'Image Preview'
     
+    def get_queryset(self, request):
+        """Annotate meme counts so the changelist doesn't COUNT per row."""
+        return super().get_queryset(request).annotate(_meme_count=Count('memes'))
+    
     def meme_count(self, obj):
         """Show count of memes created from this template."""
-        return obj.memes.count()
+        return obj._meme_count
     meme_count.short_description = 'Memes'
+    meme_count.admin_order_field = '_meme_count'
 
 
 @admin.register(Meme)
@@ -63,20 +137,19 @@ class MemeAdmin(admin.ModelAdmin):
     """Admin interface for memes."""
     
     list_display = ['id', 'template_title', 'meme_preview', 'overlay_preview', 'nsfw', 'flagged', 'created_at']
-    list_filter = ['created_at', 'template', 'nsfw', 'flagged']
+    list_filter = ['created_at', PopularTemplateFilter, 'nsfw', 'flagged']
     search_fields = ['template__title']
     readonly_fields = ['created_at', 'updated_at', 'flagged_at', 'meme_preview_large', 'text_overlays_display']
     raw_id_fields = ['template']
+    # template_title and meme_preview read obj.template on every row
+    list_select_related = ('template',)
+    # Skip the unfiltered COUNT(*) on large meme tables
+    show_full_result_count = False
     
     fieldsets = (
         (None, {
             'fields': ('template', 'nsfw', 'flagged', 'flagged_at')
         }),
-        ('Legacy Image Upload', {
-            'fields': ('image',),
-            'classes': ('collapse',),
-            'description': 'Only use if not using a template'
-        }),
         ('Text Overlays (Advanced)', {
             'fields': ('text_overlays', 'text_overlays_display'),
             'classes': ('collapse',)
@@ -99,34 +172,12 @@ class MemeAdmin(admin.ModelAdmin):
     
     def meme_preview(self, obj):
         """Show a small meme preview in the list."""
-        url = None
-        if obj.generated_image:
-            url = obj.generated_image.url
-        elif obj.get_source_image():
-            url = obj.get_source_image().url
-        
-        if url:
-            return format_html(
-                '<img src="{}" style="max-height: 50px; max-width: 80px; object-fit: cover; border-radius: 4px;">',
-                url
-            )
-        return '-'
+        return _render_preview(obj.get_display_image_url(), _THUMBNAIL_PREVIEW_HTML)
     meme_preview.short_description = 'Preview'
     
     def meme_preview_large(self, obj):
         """Show a larger meme preview in the detail view."""
-        url = None
-        if obj.generated_image:
-            url = obj.generated_image.url
-        elif obj.get_source_image():
-            url = obj.get_source_image().url
-        
-        if url:
-            return format_html(
-                '<img src="{}" style="max-height: 400px; max-width: 100%; object-fit: contain; border-radius: 8px;">',
-                url
-            )
-        return '-'
+        return _render_preview(obj.get_display_image_url(), _MEME_PREVIEW_HTML)
     meme_preview_large.short_description = 'Meme Preview'
     
     def overlay_preview(self, obj):
@@ -140,7 +191,6 @@ class MemeAdmin(admin.ModelAdmin):
     
     def text_overlays_display(self, obj):
         """Display text overlays as formatted JSON."""
-        import json
         if obj.text_overlays:
             return format_html(
                 '<pre style="background: #f5f5f5; padding: 10px; border-radius: 4px; overflow-x: auto;">{}</pre>',
@@ -154,14 +204,34 @@ class MemeAdmin(admin.ModelAdmin):
     @admin.action(description='Regenerate meme images')
     def regenerate_images(self, request, queryset):
         """Regenerate the composite images for selected memes."""
-        count = 0
-        for meme in queryset:
-            if meme.generate_image(save=True):
-                count += 1
+        memes = list(queryset.select_related('template'))
+        
+        # Render and store each image, then write all paths in one query.
+        updated = []
+        old_paths = []
+        now = timezone.now()
+        for meme in memes:
+            result = meme.generate_image()
+            if result:
+                filename, content = result
+                if meme.generated_image:
+                    old_paths.append(meme.generated_image.name)
+                meme.generated_image.name = default_storage.save(
+                    meme_upload_path(meme, filename), content
+                )
+                # bulk_update() skips auto_now, so stamp updated_at here.
+                meme.updated_at = now
+                updated.append(meme)
+        if updated:
+            Meme.objects.bulk_update(updated, ['generated_image', 'updated_at'])
+        # Replaced images are removed once the new paths are committed,
+        # as the post_delete hook does for deleted memes.
+        for path in old_paths:
+            transaction.on_commit(functools.partial(delete_stored_file, path))
         
         self.message_user(
             request,
-            f'Successfully regenerated {count} of {queryset.count()} meme images.'
+            f'Successfully regenerated {len(updated)} of {len(memes)} meme images.'
         )
 
 
@@ -226,6 +296,11 @@ class ExternalSourceQueryAdmin(admin.ModelAdmin):
             'classes': ('collapse',),
         }),
     )
+    
+    def get_queryset(self, request):
+        """Leave the raw API payloads out of the changelist query."""
+        # The change form still shows result_json; it loads on first access.
+        return super().get_queryset(request).defer('result_json')
 
 
 @admin.register(TemplateLink)
@@ -262,6 +337,8 @@ class MemeLinkAdmin(admin.ModelAdmin):
     search_fields = ['meme__template__title', 'link_type']
     readonly_fields = ['created_at']
     raw_id_fields = ['meme']
+    # See MemeFlagAdmin: the meme column needs its template joined too
+    list_select_related = ('meme__template', 'content_type')
     
     fieldsets = (
         (None, {
@@ -296,6 +373,9 @@ class MemeFlagAdmin(admin.ModelAdmin):
     search_fields = ['meme__template__title', 'user__username']
     readonly_fields = ['created_at']
     raw_id_fields = ['meme', 'user']
+    # Meme.__str__ reads meme.template, which the automatic select_related
+    # for list_display foreign keys doesn't follow
+    list_select_related = ('meme__template', 'user')
 
 
 # Add inlines to the main admin classes
@@ -70,7 +70,16 @@ MEME_MAKER = {
 }
 """
 
+import functools
+import sys
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
 
 
 class MemeMakerSettings:
@@ -111,26 +120,75 @@ class MemeMakerSettings:
         'FONT_PATH': None,  # Custom font path for meme text
     }
     
-    def __init__(self):
-        self._cached_settings = None
+    def load(self):
+        """
+        Snapshot MEME_MAKER merged over DEFAULTS into instance attributes.
+        
+        Once loaded, settings are plain instance attributes, so reading one
+        never goes through __getattr__. The template context is built here
+        as well, once per load.
+        """
+        user_settings = getattr(settings, 'MEME_MAKER', {})
+        for key, default in self.DEFAULTS.items():
+            self.__dict__[key] = user_settings.get(key, default)
+        self.__dict__['_context'] = self._build_context()
     
-    @property
-    def user_settings(self):
-        if self._cached_settings is None:
-            self._cached_settings = getattr(settings, 'MEME_MAKER', {})
-        return self._cached_settings
+    def reset(self):
+        """Drop the snapshot so the next access re-reads MEME_MAKER."""
+        for key in self.DEFAULTS:
+            self.__dict__.pop(key, None)
+        self.__dict__.pop('_context', None)
+        self.__dict__.pop('_linked_object_resolver', None)
     
     def __getattr__(self, attr):
+        # Only reached for names missing from the instance: settings before
+        # the first load (or after a reset), and names that aren't settings.
         if attr not in self.DEFAULTS:
             raise AttributeError(f"Invalid meme maker setting: '{attr}'")
         
-        return self.user_settings.get(attr, self.DEFAULTS[attr])
+        self.load()
+        return self.__dict__[attr]
     
     def get_context(self):
-        """Get all settings as a context dict for templates."""
+        """
+        Get all settings as a context dict for templates.
+        
+        The dict is shared between callers; copy it before modifying.
+        """
+        context = self.__dict__.get('_context')
+        if context is None:
+            self.load()
+            context = self.__dict__['_context']
+        return context
+    
+    def get_linked_object_resolver(self):
+        """
+        Return LINKED_OBJECT_RESOLVER as a callable, or None if unset.
+        
+        A dotted path is imported on first use rather than at load time, so
+        loading settings never imports project code, and the result is kept
+        until the next reset.
+        """
+        try:
+            return self.__dict__['_linked_object_resolver']
+        except KeyError:
+            pass
+        resolver = self.LINKED_OBJECT_RESOLVER or None
+        if isinstance(resolver, str):
+            resolver = import_string(resolver)
+        if resolver is not None and not callable(resolver):
+            raise ImproperlyConfigured(
+                "MEME_MAKER['LINKED_OBJECT_RESOLVER'] must be a callable or dotted path."
+            )
+        self.__dict__['_linked_object_resolver'] = resolver
+        return resolver
+    
+    def _build_context(self):
+        # The derived keys are built at runtime, so intern them like the
+        # literal keys below; runs once per load.
         context = {}
         for key in self.DEFAULTS:
-            context[f'meme_maker_{key.lower()}'] = getattr(self, key)
+            context[sys.intern(f'meme_maker_{key.lower()}')] = getattr(self, key)
         template_set = getattr(self, 'TEMPLATE_SET', None)
         base_template = getattr(self, 'BASE_TEMPLATE', None)
         default_base = self.DEFAULTS.get('BASE_TEMPLATE', 'meme_maker/base.html')
@@ -152,3 +210,128 @@ class MemeMakerSettings:
 
 # Global settings instance
 meme_maker_settings = MemeMakerSettings()
+
+
+@dataclass(frozen=True, slots=True)
+class AppSettings:
+    """
+    The settings exposed by MemeMakerConfig.get_*(), resolved once.
+    
+    Built when the app is ready and rebuilt when MEME_MAKER changes.
+    Field names are the lowercased MEME_MAKER keys.
+    """
+    upload_path: str
+    base_template: str
+    primary_color: str
+    secondary_color: str
+    title: str
+    embed_mode: bool
+    show_nav: bool
+    custom_css: str
+    
+    @classmethod
+    def from_settings(cls):
+        """Build from the shared meme_maker_settings snapshot."""
+        return cls(**{
+            field.name: getattr(meme_maker_settings, field.name.upper())
+            for field in fields(cls)
+        })
+
+
+_app_settings = None
+
+
+def load_app_settings():
+    """(Re)build the AppSettings instance from the current MEME_MAKER."""
+    global _app_settings
+    _app_settings = AppSettings.from_settings()
+    return _app_settings
+
+
+def get_app_settings():
+    """Return the resolved AppSettings, building it on first use."""
+    if _app_settings is None:
+        return load_app_settings()
+    return _app_settings
+
+
+# Module-level accessors, also exposed as MemeMakerConfig.get_*()
+
+def get_setting(name, default=None):
+    """Get a setting from MEME_MAKER settings dict or return default."""
+    user_settings = getattr(settings, 'MEME_MAKER', {})
+    if name not in user_settings:
+        return default
+    if name in MemeMakerSettings.DEFAULTS:
+        return getattr(meme_maker_settings, name)
+    return user_settings[name]
+
+
+def get_upload_path():
+    """Get the upload path for meme images."""
+    return get_app_settings().upload_path
+
+
+def get_base_template():
+    """Get the base template to extend from."""
+    return get_app_settings().base_template
+
+
+def get_primary_color():
+    """Get the primary color for the meme maker UI."""
+    return get_app_settings().primary_color
+
+
+def get_secondary_color():
+    """Get the secondary color for the meme maker UI."""
+    return get_app_settings().secondary_color
+
+
+def get_title():
+    """Get the title for the meme maker."""
+    return get_app_settings().title
+
+
+def get_embed_mode():
+    """Check if embed mode is enabled (renders without full page wrapper)."""
+    return get_app_settings().embed_mode
+
+
+def get_show_nav():
+    """Check if navigation should be shown."""
+    return get_app_settings().show_nav
+
+
+def get_custom_css():
+    """Get custom CSS to inject into templates."""
+    return get_app_settings().custom_css
+
+
+@functools.lru_cache(maxsize=1)
+def get_all_settings():
+    """
+    Get all AppSettings values as a dict for template context.
+    
+    The mapping is built once and shared; it is read-only.
+    """
+    app_settings = get_app_settings()
+    return MappingProxyType({
+        field.name: getattr(app_settings, field.name) for field in fields(app_settings)
+    })
+
+
+# Settings the cached fonts and watermarks are resolved from
+_RENDER_SETTINGS = frozenset({'MEME_MAKER', 'STATICFILES_DIRS', 'STATIC_ROOT', 'BASE_DIR'})
+
+
+@receiver(setting_changed)
+def _reset_meme_maker_settings(setting, **kwargs):
+    """Re-read MEME_MAKER after it is overridden (e.g. in tests)."""
+    global _app_settings
+    if setting == 'MEME_MAKER':
+        meme_maker_settings.reset()
+        _app_settings = None
+        get_all_settings.cache_clear()
+    if setting in _RENDER_SETTINGS:
+        from .models import clear_render_caches
+        clear_render_caches()
@@ -29,6 +29,10 @@ def meme_maker_context(request):
     Then in templates:
         {{ meme_maker_primary_color }}
         {{ meme_maker_title }}
+    
+    The dict is built once per settings load and shared between requests;
+    Django copies processor output into each context. Values are kept as
+    plain objects rather than lazy proxies: they cost nothing per request,
+    and {% extends meme_maker_base_template %} needs a real str.
     """
     return meme_maker_settings.get_context()
-
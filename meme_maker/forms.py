@@ -3,14 +3,49 @@ Forms for django-meme-maker.
 
 Provides forms for:
 - MemeTemplateForm: Uploading new meme templates
-- MemeTemplateSearchForm: Searching templates
+- MemeTemplateSearchForm: Searching templates (clean_search_query for the query alone)
 - MemeEditorForm: Creating memes from templates with text overlays
 """
 
-import json
 from django import forms
 from .models import MemeTemplate
 
+# orjson is an optional extra (pip install django-meme-maker[fast]) that
+# parses the advanced editor payload several times faster than the stdlib.
+# Both libraries raise ValueError subclasses on malformed input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Widget attrs shared by the form classes below. Widget.__init__ copies the
+# dict it is given, so one module-level constant can back any number of
+# widgets without them sharing state.
+_CHECKBOX_ATTRS = {
+    'class': 'meme-checkbox',
+}
+_COLOR_ATTRS = {
+    'class': 'meme-form-control meme-color-picker',
+    'type': 'color',
+}
+_TOP_TEXT_ATTRS = {
+    'class': 'meme-form-control meme-editor-text',
+    'placeholder': 'Top text (optional)',
+    'data-position': 'top',
+}
+_BOTTOM_TEXT_ATTRS = {
+    'class': 'meme-form-control meme-editor-text',
+    'placeholder': 'Bottom text (optional)',
+    'data-position': 'bottom',
+}
+_FONT_SIZE_ATTRS = {
+    'class': 'meme-form-control',
+    'type': 'range',
+    'min': '12',
+    'max': '200',
+}
+
 
 class MemeTemplateForm(forms.ModelForm):
     """
@@ -39,9 +74,7 @@ class MemeTemplateForm(forms.ModelForm):
                 'placeholder': 'Enter tags separated by commas (e.g., funny, reaction, trending)',
                 'maxlength': '500',
             }),
-            'nsfw': forms.CheckboxInput(attrs={
-                'class': 'meme-checkbox',
-            }),
+            'nsfw': forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         }
         labels = {
             'image': 'Template Image',
@@ -57,6 +90,22 @@ class MemeTemplateForm(forms.ModelForm):
         }
 
 
+SEARCH_QUERY_MAX_LENGTH = 200
+# Upper bound on the advanced editor payload; anything larger is ignored
+# without being parsed.
+OVERLAYS_JSON_MAX_LENGTH = 64 * 1024
+
+
+def clean_search_query(raw):
+    """
+    Normalize a template search query from the querystring.
+    
+    Views use this instead of binding and validating MemeTemplateSearchForm
+    on every search request.
+    """
+    return (raw or '').strip()[:SEARCH_QUERY_MAX_LENGTH]
+
+
 class MemeTemplateSearchForm(forms.Form):
     """
     Form for searching meme templates.
@@ -65,6 +114,7 @@ class MemeTemplateSearchForm(forms.Form):
     """
     q = forms.CharField(
         required=False,
+        max_length=SEARCH_QUERY_MAX_LENGTH,
         widget=forms.TextInput(attrs={
             'class': 'meme-form-control',
             'placeholder': 'Search templates by name or tags...',
@@ -86,22 +136,14 @@ class MemeEditorForm(forms.Form):
     top_text = forms.CharField(
         required=False,
         max_length=200,
-        widget=forms.TextInput(attrs={
-            'class': 'meme-form-control meme-editor-text',
-            'placeholder': 'Top text (optional)',
-            'data-position': 'top',
-        }),
+        widget=forms.TextInput(attrs=_TOP_TEXT_ATTRS),
         label='Top Text',
     )
     
     bottom_text = forms.CharField(
         required=False,
         max_length=200,
-        widget=forms.TextInput(attrs={
-            'class': 'meme-form-control meme-editor-text',
-            'placeholder': 'Bottom text (optional)',
-            'data-position': 'bottom',
-        }),
+        widget=forms.TextInput(attrs=_BOTTOM_TEXT_ATTRS),
         label='Bottom Text',
     )
     
@@ -118,20 +160,14 @@ class MemeEditorForm(forms.Form):
     text_color = forms.CharField(
         required=False,
         initial='#FFFFFF',
-        widget=forms.TextInput(attrs={
-            'class': 'meme-form-control meme-color-picker',
-            'type': 'color',
-        }),
+        widget=forms.TextInput(attrs=_COLOR_ATTRS),
         label='Text Color',
     )
     
     stroke_color = forms.CharField(
         required=False,
         initial='#000000',
-        widget=forms.TextInput(attrs={
-            'class': 'meme-form-control meme-color-picker',
-            'type': 'color',
-        }),
+        widget=forms.TextInput(attrs=_COLOR_ATTRS),
         label='Stroke Color',
     )
     
@@ -140,30 +176,21 @@ class MemeEditorForm(forms.Form):
         initial=48,
         min_value=12,
         max_value=200,
-        widget=forms.NumberInput(attrs={
-            'class': 'meme-form-control',
-            'type': 'range',
-            'min': '12',
-            'max': '200',
-        }),
+        widget=forms.NumberInput(attrs=_FONT_SIZE_ATTRS),
         label='Font Size',
     )
     
     uppercase = forms.BooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'meme-checkbox',
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label='UPPERCASE',
     )
 
     nsfw = forms.BooleanField(
         required=False,
         initial=False,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'meme-checkbox',
-        }),
+        widget=forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
         label='NSFW',
     )
     
@@ -176,49 +203,54 @@ class MemeEditorForm(forms.Form):
         
         If JSON is provided (advanced mode), use that.
         Otherwise, build from simple top/bottom fields.
+        
+        The result is computed once per form instance; repeated calls return
+        the same list and dict.
         """
+        try:
+            return self._overlays_with_meta
+        except AttributeError:
+            pass
+        self._overlays_with_meta = self._build_overlays_with_meta()
+        return self._overlays_with_meta
+    
+    def _build_overlays_with_meta(self):
         json_data = self.cleaned_data.get('text_overlays_json')
         
-        if json_data:
+        # CharField strips whitespace, so a valid payload starts with [ or {.
+        # Skip the parser for oversized or obviously non-JSON input.
+        if (
+            json_data
+            and len(json_data) <= OVERLAYS_JSON_MAX_LENGTH
+            and json_data[0] in '[{'
+        ):
             try:
-                data = json.loads(json_data)
+                data = _json_loads(json_data)
                 if isinstance(data, list):
                     return data, {}
                 elif isinstance(data, dict) and 'overlays' in data:
                     meta = data.get('meta', {})
                     return data['overlays'], meta
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         
         # Build from simple fields (no meta available from JS)
-        overlays = []
-        
-        text_color = self.cleaned_data.get('text_color', '#FFFFFF')
-        stroke_color = self.cleaned_data.get('stroke_color', '#000000')
-        font_size = self.cleaned_data.get('font_size', 48)
-        uppercase = self.cleaned_data.get('uppercase', True)
-        
         top_text = self.cleaned_data.get('top_text', '').strip()
-        if top_text:
-            overlays.append({
-                'text': top_text,
-                'position': 'top',
-                'color': text_color,
-                'stroke_color': stroke_color,
-                'font_size': font_size,
-                'uppercase': uppercase,
-            })
-        
         bottom_text = self.cleaned_data.get('bottom_text', '').strip()
+        if not top_text and not bottom_text:
+            return [], {}
+        
+        style = {
+            'color': self.cleaned_data.get('text_color', '#FFFFFF'),
+            'stroke_color': self.cleaned_data.get('stroke_color', '#000000'),
+            'font_size': self.cleaned_data.get('font_size', 48),
+            'uppercase': self.cleaned_data.get('uppercase', True),
+        }
+        overlays = []
+        if top_text:
+            overlays.append({'text': top_text, 'position': 'top', **style})
         if bottom_text:
-            overlays.append({
-                'text': bottom_text,
-                'position': 'bottom',
-                'color': text_color,
-                'stroke_color': stroke_color,
-                'font_size': font_size,
-                'uppercase': uppercase,
-            })
+            overlays.append({'text': bottom_text, 'position': 'bottom', **style})
         
         return overlays, {}
     
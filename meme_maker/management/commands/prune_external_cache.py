@@ -0,0 +1,40 @@
+"""
+Delete stale external search cache entries.
+
+Usage:
+    python manage.py prune_external_cache
+    python manage.py prune_external_cache --days 90
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...conf import meme_maker_settings
+from ...models import ExternalSourceQuery
+
+
+class Command(BaseCommand):
+    help = "Delete external search cache entries older than the cache lifetime."
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help="Delete entries fetched more than this many days ago "
+                 "(defaults to IMGFLIP_CACHE_DAYS, or 30 if caching is off).",
+        )
+    
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is None:
+            days = int(meme_maker_settings.IMGFLIP_CACHE_DAYS or 30)
+        cutoff = timezone.now() - timedelta(days=days)
+        
+        # Entries older than the cache lifetime are refetched on their next
+        # search anyway. Nothing cascades from ExternalSourceQuery and it has
+        # no delete signals, so this runs as one DELETE, without loading rows.
+        deleted, _ = ExternalSourceQuery.objects.filter(fetched_at__lt=cutoff).delete()
+        self.stdout.write(f"Deleted {deleted} cached quer{'y' if deleted == 1 else 'ies'}.")
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0011_rename_meme_maker__fetched_at_idx_meme_maker__fetched_dbc539_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='memeflag',
+            index=models.Index(fields=['user', 'created_at'], name='meme_maker__user_id_578332_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='templateflag',
+            index=models.Index(fields=['user', 'created_at'], name='meme_maker__user_id_af3942_idx'),
+        ),
+    ]
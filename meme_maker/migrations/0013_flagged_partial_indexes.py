@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0012_flag_user_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meme',
+            index=models.Index(condition=models.Q(('flagged', True)), fields=['-flagged_at'], name='meme_maker_meme_flagged_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='memetemplate',
+            index=models.Index(condition=models.Q(('flagged', True)), fields=['-flagged_at'], name='meme_maker_tpl_flagged_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0013_flagged_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='externalsourcequery',
+            name='normalized_query',
+            field=models.CharField(help_text='Normalized query for cache lookups', max_length=300),
+        ),
+    ]
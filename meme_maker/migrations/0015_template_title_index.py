@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0014_external_query_drop_redundant_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='memetemplate',
+            name='title',
+            field=models.CharField(db_index=True, help_text='Searchable title for the template', max_length=200),
+        ),
+    ]
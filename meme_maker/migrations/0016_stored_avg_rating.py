@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:13
+
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+
+def backfill_avg_rating(apps, schema_editor):
+    for model_name in ('Meme', 'MemeTemplate'):
+        model = apps.get_model('meme_maker', model_name)
+        model.objects.filter(rating_count__gt=0).update(
+            avg_rating=Cast(F('rating_sum'), FloatField()) / Cast(F('rating_count'), FloatField())
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0015_template_title_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meme',
+            name='avg_rating',
+            field=models.FloatField(db_index=True, default=0.0, editable=False, help_text='Average rating, maintained from rating_sum and rating_count'),
+        ),
+        migrations.AddField(
+            model_name='memetemplate',
+            name='avg_rating',
+            field=models.FloatField(db_index=True, default=0.0, editable=False, help_text='Average rating, maintained from rating_sum and rating_count'),
+        ),
+        migrations.RunPython(backfill_avg_rating, migrations.RunPython.noop),
+    ]
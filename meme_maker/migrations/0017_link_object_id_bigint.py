@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('meme_maker', '0016_stored_avg_rating'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='memelink',
+            name='content_type',
+            field=models.ForeignKey(db_index=False, help_text='The type of object being linked to', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype'),
+        ),
+        migrations.AlterField(
+            model_name='memelink',
+            name='object_id',
+            field=models.PositiveBigIntegerField(help_text='The ID of the object being linked to'),
+        ),
+        migrations.AlterField(
+            model_name='templatelink',
+            name='content_type',
+            field=models.ForeignKey(db_index=False, help_text='The type of object being linked to', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype'),
+        ),
+        migrations.AlterField(
+            model_name='templatelink',
+            name='object_id',
+            field=models.PositiveBigIntegerField(help_text='The ID of the object being linked to'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meme_maker', '0017_link_object_id_bigint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='memeflag',
+            name='meme',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='flags', to='meme_maker.meme'),
+        ),
+        migrations.AlterField(
+            model_name='memeflag',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='meme_flags', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='templateflag',
+            name='template',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='flags', to='meme_maker.memetemplate'),
+        ),
+        migrations.AlterField(
+            model_name='templateflag',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='template_flags', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -45,6 +45,7 @@ Usage:
     meme.link_to(product)
     meme.link_to(blog_post)
     template.link_to(campaign)
+    meme.bulk_link_to([product, blog_post])
     
     # Query linked objects
     meme.get_linked_objects()
@@ -55,10 +56,16 @@ Usage:
     MemeTemplate.objects.linked_to(campaign)
 """
 
+import functools
 import json
 import io
+import os
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.conf import settings
 from django.urls import reverse
 from django.core.files.storage import default_storage
@@ -74,52 +81,66 @@ from .conf import meme_maker_settings
 # CUSTOM MANAGERS WITH LINKING SUPPORT
 # =============================================================================
 
-class LinkableManager(models.Manager):
+class LinkableQuerySet(models.QuerySet):
     """
-    Custom manager that adds linked_to() queryset method.
+    QuerySet that adds linked_to(), so it can be chained after other filters.
     
     Usage:
-        Meme.objects.linked_to(my_product)
-        MemeTemplate.objects.linked_to(my_campaign)
+        Meme.objects.filter(flagged=False).linked_to(my_product)
+        template.memes.linked_to(my_campaign)
     """
     
     def linked_to(self, obj):
         """
         Return all instances linked to the given object.
         
+        Filters across the object_links reverse relation, so the database
+        does a single JOIN on the link table's (content_type, object_id)
+        index. Links are unique per (instance, content_type, object_id), so
+        the JOIN never duplicates rows.
+        
         Args:
             obj: Any Django model instance
             
         Returns:
             QuerySet of instances linked to obj
         """
-        content_type = ContentType.objects.get_for_model(obj)
-        # Get the related link model name (e.g., 'object_links')
-        link_model = self.model._meta.get_field('object_links').related_model
-        linked_ids = link_model.objects.filter(
-            content_type=content_type,
-            object_id=obj.pk
-        ).values_list(self._get_fk_field_name(), flat=True)
-        return self.filter(pk__in=linked_ids)
+        return self.filter(
+            object_links__content_type=ContentType.objects.get_for_model(obj),
+            object_links__object_id=obj.pk,
+        )
     
-    def _get_fk_field_name(self):
-        """Get the FK field name in the link model (meme_id or template_id)."""
-        # This will be overridden by subclasses
-        raise NotImplementedError
+    def with_links(self):
+        """
+        Prefetch each instance's links and the objects they point to.
+        
+        Costs one query for the links plus one per linked content type,
+        however many instances are loaded; get_linked_objects() then reads
+        from the prefetched links instead of querying.
+        
+        Usage:
+            for meme in Meme.objects.with_links()[:20]:
+                meme.get_linked_objects()
+        """
+        return self.prefetch_related('object_links__linked_object')
+
+
+class LinkableManager(models.Manager.from_queryset(LinkableQuerySet)):
+    """
+    Custom manager that adds linked_to() queryset method.
+    
+    Usage:
+        Meme.objects.linked_to(my_product)
+        MemeTemplate.objects.linked_to(my_campaign)
+    """
 
 
 class MemeManager(LinkableManager):
     """Manager for Meme model with linking support."""
-    
-    def _get_fk_field_name(self):
-        return 'meme_id'
 
 
 class MemeTemplateManager(LinkableManager):
     """Manager for MemeTemplate model with linking support."""
-    
-    def _get_fk_field_name(self):
-        return 'template_id'
 
 
 # =============================================================================
@@ -149,20 +170,49 @@ class LinkableMixin:
             meme.link_to(product)
             template.link_to(campaign, link_type='featured')
         """
-        content_type = ContentType.objects.get_for_model(obj)
-        link_model = self._meta.get_field('object_links').related_model
-        
-        # Get the FK field name for this model
-        fk_field = 'meme' if hasattr(link_model, 'meme') else 'template'
-        
-        link, created = link_model.objects.get_or_create(
-            **{fk_field: self},
-            content_type=content_type,
+        # The object_links related manager fills in the meme/template FK
+        link, created = self.object_links.get_or_create(
+            content_type=ContentType.objects.get_for_model(obj),
             object_id=obj.pk,
             defaults=extra_fields
         )
         return link
     
+    def bulk_link_to(self, objs, batch_size=None, **extra_fields):
+        """
+        Link this instance to several objects with a single INSERT.
+        
+        Objects that are already linked are skipped; their existing links
+        are left unchanged.
+        
+        Args:
+            objs: Iterable of Django model instances to link to
+            batch_size: Optional - cap the rows per INSERT for very long lists
+            **extra_fields: Optional extra fields for every new link
+            
+        Example:
+            meme.bulk_link_to([product, campaign], link_type='featured')
+        """
+        objs = list(objs)
+        if not objs:
+            return
+        content_types = ContentType.objects.get_for_models(*{type(obj) for obj in objs})
+        link_model = self.object_links.model
+        fk_field = self.object_links.field.name
+        link_model.objects.bulk_create(
+            [
+                link_model(
+                    **{fk_field: self},
+                    content_type=content_types[type(obj)],
+                    object_id=obj.pk,
+                    **extra_fields
+                )
+                for obj in objs
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+    
     def unlink_from(self, obj):
         """
         Remove link to another object.
@@ -173,13 +223,8 @@ class LinkableMixin:
         Returns:
             True if link was removed, False if it didn't exist
         """
-        content_type = ContentType.objects.get_for_model(obj)
-        link_model = self._meta.get_field('object_links').related_model
-        fk_field = 'meme' if hasattr(link_model, 'meme') else 'template'
-        
-        deleted, _ = link_model.objects.filter(
-            **{fk_field: self},
-            content_type=content_type,
+        deleted, _ = self.object_links.filter(
+            content_type=ContentType.objects.get_for_model(obj),
             object_id=obj.pk
         ).delete()
         return deleted > 0
@@ -214,13 +259,39 @@ class LinkableMixin:
             meme.get_linked_objects()  # All linked objects
             meme.get_linked_objects(Product)  # Only linked Products
         """
+        if 'object_links' in getattr(self, '_prefetched_objects_cache', {}):
+            # Loaded by with_links(); filter the prefetched links in Python
+            content_type = (
+                ContentType.objects.get_for_model(model_class) if model_class else None
+            )
+            return [
+                link.linked_object for link in self.object_links.all()
+                if link.linked_object is not None
+                and (content_type is None or link.content_type_id == content_type.pk)
+            ]
+        
         links = self.object_links.all()
         
         if model_class:
             content_type = ContentType.objects.get_for_model(model_class)
             links = links.filter(content_type=content_type)
         
-        return [link.linked_object for link in links if link.linked_object]
+        # Only the key pairs are loaded, then each content type's objects
+        # are fetched with one in_bulk() query rather than one per link
+        keys = list(links.values_list('content_type_id', 'object_id'))
+        ids_by_type = {}
+        for content_type_id, object_id in keys:
+            ids_by_type.setdefault(content_type_id, []).append(object_id)
+        
+        objects = {}
+        for content_type_id, object_ids in ids_by_type.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None:
+                continue
+            for pk, obj in model._base_manager.in_bulk(object_ids).items():
+                objects[content_type_id, pk] = obj
+        
+        return [objects[key] for key in keys if key in objects]
     
     def get_links(self, model_class=None):
         """
@@ -257,6 +328,168 @@ def meme_upload_path(instance, filename):
     return f'{upload_path}generated/{filename}'
 
 
+# =============================================================================
+# FONT LOADING
+# =============================================================================
+
+# Bundled Anton font: an open-source Impact-like fallback
+BUNDLED_FONT_PATH = os.path.join(
+    os.path.dirname(__file__), 'static', 'meme_maker', 'fonts', 'Anton-Regular.ttf'
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_font_path(custom_font):
+    """
+    Return the first font that FreeType can open, or None.
+    
+    Priority:
+    1. Custom font from MEME_MAKER['FONT_PATH'] setting
+    2. Impact font from system paths
+    3. Bundled Anton font (Impact-like, open source)
+    
+    Cached per FONT_PATH value, so the candidates are probed once per
+    process rather than once per overlay.
+    """
+    from PIL import ImageFont
+    
+    font_paths = [custom_font] if custom_font else []
+    # System Impact font locations
+    font_paths.extend([
+        "Impact",
+        "/System/Library/Fonts/Supplemental/Impact.ttf",  # macOS
+        "/usr/share/fonts/truetype/msttcorefonts/Impact.ttf",  # Linux (msttcorefonts)
+        "/usr/share/fonts/TTF/impact.ttf",  # Arch Linux
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux fallback
+        "C:\\Windows\\Fonts\\impact.ttf",  # Windows
+    ])
+    font_paths.append(BUNDLED_FONT_PATH)
+    
+    for font_path in font_paths:
+        try:
+            ImageFont.truetype(font_path, 12)
+        except (IOError, OSError):
+            continue
+        return font_path
+    
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(
+        "No suitable meme font found. Text may appear very small. "
+        "Install Impact font or set MEME_MAKER['FONT_PATH'] to a .ttf file."
+    )
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(custom_font, size):
+    from PIL import ImageFont
+    
+    font_path = _resolve_font_path(custom_font)
+    if font_path is None:
+        # Last resort: Pillow default (very small bitmap font)
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_path, size)
+
+
+def load_meme_font(size):
+    """
+    Load the meme font at the given pixel size.
+    
+    Fonts are cached by (FONT_PATH, size) and shared between renders;
+    Pillow font objects are read-only once loaded.
+    """
+    return _load_font(meme_maker_settings.FONT_PATH, size)
+
+
+# =============================================================================
+# WATERMARK
+# =============================================================================
+
+# WATERMARK_IMAGE value -> file found on disk. Misses are not stored, so a
+# watermark that appears later (e.g. after collectstatic) is picked up.
+_watermark_paths = {}
+
+
+def _resolve_watermark_path(watermark_path):
+    """
+    Find the WATERMARK_IMAGE file on disk, or return None.
+    
+    Tries the setting as an absolute path, then through the staticfiles
+    finders, then relative to BASE_DIR. Found paths are cached per setting
+    value, so a successful lookup runs once per process.
+    """
+    found_path = _watermark_paths.get(watermark_path)
+    if found_path is None:
+        found_path = _find_watermark_path(watermark_path)
+        if found_path is not None:
+            _watermark_paths[watermark_path] = found_path
+    return found_path
+
+
+def _find_watermark_path(watermark_path):
+    # If it's an absolute path, use it directly
+    if os.path.isabs(watermark_path) and os.path.exists(watermark_path):
+        return watermark_path
+    
+    # Try to find in static files
+    from django.contrib.staticfiles import finders
+    found_path = finders.find(watermark_path)
+    if found_path:
+        return found_path
+    
+    # Try relative to BASE_DIR if available
+    base_dir = getattr(settings, 'BASE_DIR', None)
+    if base_dir:
+        full_path = os.path.join(base_dir, watermark_path)
+        if os.path.exists(full_path):
+            return full_path
+    
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.warning(f"Watermark image not found: {watermark_path}")
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _get_prepared_watermark(found_path, width, opacity):
+    """
+    Load the watermark resized to width with opacity applied.
+    
+    Memes of the same width share one prepared watermark, so the file is
+    decoded, resized and alpha-adjusted once rather than per meme.
+    The returned image is only ever pasted from, never modified.
+    """
+    from PIL import Image
+    
+    # Ensure watermark has alpha channel
+    with Image.open(found_path) as source:
+        watermark_img = source.convert('RGBA')
+    
+    # Resize watermark, keeping its aspect ratio
+    wm_width, wm_height = watermark_img.size
+    height = int(width * wm_height / wm_width)
+    watermark_img = watermark_img.resize((width, height), Image.LANCZOS)
+    
+    # Apply opacity to watermark
+    if opacity < 1.0:
+        # Adjust alpha channel through a precomputed lookup table, which
+        # Pillow applies in C without calling back into Python
+        r, g, b, a = watermark_img.split()
+        a = a.point([int(x * opacity) for x in range(256)])
+        watermark_img = Image.merge('RGBA', (r, g, b, a))
+    
+    return watermark_img
+
+
+def clear_render_caches():
+    """Drop cached fonts and watermarks, e.g. after settings change."""
+    _resolve_font_path.cache_clear()
+    _load_font.cache_clear()
+    _watermark_paths.clear()
+    _get_prepared_watermark.cache_clear()
+
+
 class RatingMixin:
     """
     Mixin providing rating functionality.
@@ -264,8 +497,19 @@ class RatingMixin:
     Classes using this mixin should have:
     - rating_sum: IntegerField for sum of all ratings
     - rating_count: IntegerField for number of ratings
+    - avg_rating: indexed FloatField, kept in step with the two above on
+      save so lists can be sorted by rating without computing it per row
     """
     
+    RATING_FIELDS = frozenset({'rating_sum', 'rating_count'})
+    
+    def save(self, *args, **kwargs):
+        self.avg_rating = self.rating_sum / self.rating_count if self.rating_count else 0.0
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.RATING_FIELDS.intersection(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'avg_rating'}
+        super().save(*args, **kwargs)
+    
     def get_average_rating(self):
         """Calculate and return the average rating (0-5)."""
         if self.rating_count == 0:
@@ -292,9 +536,7 @@ class RatingMixin:
         if not 1 <= stars <= 5:
             raise ValueError("Rating must be between 1 and 5")
         
-        self.rating_sum += stars
-        self.rating_count += 1
-        self.save(update_fields=['rating_sum', 'rating_count'])
+        self._change_rating(stars, 1)
         return self.get_average_rating()
     
     def update_rating(self, old_stars, new_stars):
@@ -311,9 +553,28 @@ class RatingMixin:
         if not 1 <= new_stars <= 5:
             raise ValueError("Rating must be between 1 and 5")
         
-        self.rating_sum = self.rating_sum - old_stars + new_stars
-        self.save(update_fields=['rating_sum', 'rating_count'])
+        self._change_rating(new_stars - old_stars, 0)
         return self.get_average_rating()
+    
+    def _change_rating(self, sum_delta, count_delta):
+        """
+        Apply a rating change in the database and reload the totals.
+        
+        The totals are incremented with F() expressions, so concurrent
+        raters can't overwrite each other's votes. avg_rating is then
+        recomputed from the stored totals in a second UPDATE; computing it
+        in the first would read already-updated columns on MySQL.
+        """
+        rows = type(self)._default_manager.filter(pk=self.pk)
+        with transaction.atomic():
+            rows.update(
+                rating_sum=F('rating_sum') + sum_delta,
+                rating_count=F('rating_count') + count_delta,
+            )
+            rows.filter(rating_count__gt=0).update(
+                avg_rating=Cast(F('rating_sum'), FloatField()) / Cast(F('rating_count'), FloatField())
+            )
+        self.refresh_from_db(fields=['rating_sum', 'rating_count', 'avg_rating'])
 
 
 class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
@@ -335,6 +596,7 @@ class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
     )
     title = models.CharField(
         max_length=200,
+        db_index=True,
         help_text="Searchable title for the template"
     )
     # Tags stored as comma-separated string for simplicity and DB compatibility
@@ -367,6 +629,12 @@ class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
         default=0,
         help_text="Number of ratings received"
     )
+    avg_rating = models.FloatField(
+        default=0.0,
+        db_index=True,
+        editable=False,
+        help_text="Average rating, maintained from rating_sum and rating_count"
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -378,6 +646,14 @@ class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
         ordering = ['-created_at']
         verbose_name = 'Meme Template'
         verbose_name_plural = 'Meme Templates'
+        indexes = [
+            # Partial index: only the (few) flagged rows, for moderation
+            models.Index(
+                fields=['-flagged_at'],
+                condition=models.Q(flagged=True),
+                name='meme_maker_tpl_flagged_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -409,28 +685,16 @@ class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
             from django.db.models import Q
             qs = cls.objects.filter(
                 Q(title__icontains=query) | Q(tags__icontains=query)
-            ).distinct()
+            )
         else:
             qs = cls.objects.all()
         
         # Apply ordering
-        if order_by == 'rating' or order_by == '-rating':
-            # Order by average rating (rating_sum / rating_count)
-            # Handle division by zero by using Case/When
-            from django.db.models import Case, When, F, FloatField, Value
-            from django.db.models.functions import Cast
-            
-            qs = qs.annotate(
-                avg_rating=Case(
-                    When(rating_count=0, then=Value(0.0)),
-                    default=Cast(F('rating_sum'), FloatField()) / Cast(F('rating_count'), FloatField()),
-                    output_field=FloatField()
-                )
-            )
-            if order_by == '-rating':
-                qs = qs.order_by('-avg_rating', '-rating_count', '-created_at')
-            else:
-                qs = qs.order_by('avg_rating', 'rating_count', 'created_at')
+        if order_by == '-rating':
+            # Order by the stored average rating (rating_sum / rating_count)
+            qs = qs.order_by('-avg_rating', '-rating_count', '-created_at')
+        elif order_by == 'rating':
+            qs = qs.order_by('avg_rating', 'rating_count', 'created_at')
         elif order_by == 'created':
             qs = qs.order_by('created_at')
         elif order_by == '-created':
@@ -441,16 +705,6 @@ class MemeTemplate(LinkableMixin, RatingMixin, models.Model):
             qs = qs.order_by('-title')
         
         return qs
-    
-    def delete(self, *args, **kwargs):
-        """Override delete to also remove the image file from storage."""
-        image_path = self.image.name if self.image else None
-        super().delete(*args, **kwargs)
-        if image_path:
-            try:
-                default_storage.delete(image_path)
-            except Exception:
-                pass
 
 
 class Meme(LinkableMixin, RatingMixin, models.Model):
@@ -534,6 +788,12 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
         default=0,
         help_text="Number of ratings received"
     )
+    avg_rating = models.FloatField(
+        default=0.0,
+        db_index=True,
+        editable=False,
+        help_text="Average rating, maintained from rating_sum and rating_count"
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -545,6 +805,14 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
         ordering = ['-created_at']
         verbose_name = 'Meme'
         verbose_name_plural = 'Memes'
+        indexes = [
+            # Partial index: only the (few) flagged rows, for moderation
+            models.Index(
+                fields=['-flagged_at'],
+                condition=models.Q(flagged=True),
+                name='meme_maker_meme_flagged_idx',
+            ),
+        ]
     
     def __str__(self):
         if self.template:
@@ -642,7 +910,7 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
         Returns the filename if successful, None otherwise.
         """
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             # Pillow not available, skip generation
             return None
@@ -655,7 +923,13 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
             # Open the source image
             source_image.seek(0)
             img = Image.open(source_image)
-            img = img.convert('RGBA')
+            # Opaque sources (most templates) are drawn on in RGB and encoded
+            # as they are; only transparent ones need RGBA and the white
+            # background composite below
+            if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+                img = img.convert('RGBA')
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
             
             draw = ImageDraw.Draw(img)
             width, height = img.size
@@ -663,64 +937,16 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
             # Get overlays
             overlays = self.get_overlays()
             
-            # Font loading helper
-            def load_font(size):
-                """
-                Try to load a meme-appropriate font at given size.
-                
-                Priority:
-                1. Custom font from MEME_MAKER['FONT_PATH'] setting
-                2. Impact font from system paths
-                3. Bundled Anton font (Impact-like, open source)
-                4. Pillow default font (last resort, very small)
-                """
-                import os
-                
-                # Start with custom font if configured
-                font_paths = []
-                custom_font = meme_maker_settings.FONT_PATH
-                if custom_font:
-                    font_paths.append(custom_font)
-                
-                # System Impact font locations
-                font_paths.extend([
-                    "Impact",
-                    "/System/Library/Fonts/Supplemental/Impact.ttf",  # macOS
-                    "/usr/share/fonts/truetype/msttcorefonts/Impact.ttf",  # Linux (msttcorefonts)
-                    "/usr/share/fonts/TTF/impact.ttf",  # Arch Linux
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux fallback
-                    "C:\\Windows\\Fonts\\impact.ttf",  # Windows
-                ])
-                
-                # Add bundled Anton font as fallback
-                # Anton is an open-source Impact-like font bundled with the package
-                bundled_font = os.path.join(
-                    os.path.dirname(__file__),
-                    'static', 'meme_maker', 'fonts', 'Anton-Regular.ttf'
-                )
-                font_paths.append(bundled_font)
-                
-                for font_path in font_paths:
-                    try:
-                        return ImageFont.truetype(font_path, size)
-                    except (IOError, OSError):
-                        continue
-                
-                # Last resort: Pillow default (very small bitmap font)
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    "No suitable meme font found. Text may appear very small. "
-                    "Install Impact font or set MEME_MAKER['FONT_PATH'] to a .ttf file."
-                )
-                return ImageFont.load_default()
-            
             # Font size reference: 800px is the canonical width for font sizing
             # Both CSS preview and Pillow use 800px as the base, ensuring:
             #   - CSS: font_size * (preview_width / 800) = X% of preview
             #   - Pillow: font_size * (image_width / 800) = X% of image
             # This guarantees the text appears at the same relative size
             base_width = 800.0
+            scale_factor = width / base_width
+            
+            # Calculate max text width (90% of image, matching CSS max-width: 90%)
+            max_text_width = int(width * 0.9)
 
             # Text wrapping helper to match CSS behavior (max-width: 90%)
             def wrap_text(text, font, max_width):
@@ -734,20 +960,28 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
                 
                 lines = []
                 current_line = []
+                current_width = 0.0
+                # Measure each word once and keep a running line width,
+                # rather than laying out the whole line again per word
+                space_width = font.getlength(' ')
                 
                 for word in words:
                     # Test if adding this word exceeds max width
-                    test_line = ' '.join(current_line + [word])
-                    bbox = draw.textbbox((0, 0), test_line, font=font)
-                    test_width = bbox[2] - bbox[0]
+                    word_width = font.getlength(word)
+                    if not current_line:
+                        test_width = word_width
+                    else:
+                        test_width = current_width + space_width + word_width
                     
                     if test_width <= max_width:
                         current_line.append(word)
+                        current_width = test_width
                     else:
                         # Line is full, start a new one
                         if current_line:
                             lines.append(' '.join(current_line))
                         current_line = [word]
+                        current_width = word_width
                 
                 # Don't forget the last line
                 if current_line:
@@ -766,14 +1000,10 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
                 # Get user-specified font size, scale it relative to image width
                 # Use preview width metadata when available, fallback to 800px
                 user_font_size = overlay.get('font_size') or 48  # Handle None values
-                scale_factor = width / base_width
                 font_size = max(16, int(user_font_size * scale_factor))
                 
                 # Load font at the correct size for this overlay
-                font = load_font(font_size)
-                
-                # Calculate max text width (90% of image, matching CSS max-width: 90%)
-                max_text_width = int(width * 0.9)
+                font = load_meme_font(font_size)
                 
                 # Wrap text to multiple lines if needed
                 lines = wrap_text(text, font, max_text_width)
@@ -799,28 +1029,27 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
                 text_color = overlay.get('color') or '#FFFFFF'
                 stroke_width = max(2, int(font_size / 16))
                 
+                # Center horizontally (or use custom x position)
+                if position in ('top', 'bottom'):
+                    x_center = width // 2
+                else:
+                    x_center = int(width * overlay.get('x', 50) / 100)
+                
                 # Draw each line
                 for i, line in enumerate(lines):
                     # Get line width for centering
                     bbox = draw.textbbox((0, 0), line, font=font)
                     line_width = bbox[2] - bbox[0]
                     
-                    # Center horizontally (or use custom x position)
-                    if position in ('top', 'bottom'):
-                        x = (width - line_width) // 2
-                    else:
-                        x = int(width * overlay.get('x', 50) / 100) - line_width // 2
-                    
+                    x = x_center - line_width // 2
                     y = start_y + (i * line_height)
                     
-                    # Draw stroke (outline)
-                    for dx in range(-stroke_width, stroke_width + 1):
-                        for dy in range(-stroke_width, stroke_width + 1):
-                            if dx * dx + dy * dy <= stroke_width * stroke_width:
-                                draw.text((x + dx, y + dy), line, font=font, fill=stroke_color)
-                    
-                    # Draw main text
-                    draw.text((x, y), line, font=font, fill=text_color)
+                    # Draw text and outline in one pass; Pillow renders the
+                    # stroke natively instead of redrawing the line per offset
+                    draw.text(
+                        (x, y), line, font=font, fill=text_color,
+                        stroke_width=stroke_width, stroke_fill=stroke_color,
+                    )
             
             # Apply watermark if configured
             img = self._apply_watermark(img)
@@ -860,78 +1089,32 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
         opacity, scale, and padding.
         
         Args:
-            img: PIL Image object (RGBA mode)
+            img: PIL Image object (RGB or RGBA mode)
             
         Returns:
             PIL Image object with watermark applied (or unchanged if no watermark)
         """
-        from PIL import Image
-        import os
-        
         watermark_path = meme_maker_settings.WATERMARK_IMAGE
         if not watermark_path:
             return img
         
         try:
-            # Try to find the watermark file
-            watermark_img = None
-            
-            # If it's an absolute path, use it directly
-            if os.path.isabs(watermark_path) and os.path.exists(watermark_path):
-                watermark_img = Image.open(watermark_path)
-            else:
-                # Try to find in static files
-                from django.contrib.staticfiles import finders
-                found_path = finders.find(watermark_path)
-                if found_path:
-                    watermark_img = Image.open(found_path)
-                else:
-                    # Try relative to BASE_DIR if available
-                    from django.conf import settings as django_settings
-                    if hasattr(django_settings, 'BASE_DIR'):
-                        full_path = os.path.join(django_settings.BASE_DIR, watermark_path)
-                        if os.path.exists(full_path):
-                            watermark_img = Image.open(full_path)
-            
-            if not watermark_img:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Watermark image not found: {watermark_path}")
-                return img
-            
-            # Ensure watermark has alpha channel
-            watermark_img = watermark_img.convert('RGBA')
-            
-            # Get settings
-            opacity = meme_maker_settings.WATERMARK_OPACITY
-            scale = meme_maker_settings.WATERMARK_SCALE
+            img_width, img_height = img.size
             padding = meme_maker_settings.WATERMARK_PADDING
             
-            # Calculate new watermark size (based on meme width)
-            img_width, img_height = img.size
-            wm_width, wm_height = watermark_img.size
+            found_path = _resolve_watermark_path(watermark_path)
+            if not found_path:
+                return img
             
             # Scale watermark to be a percentage of the meme width
-            new_wm_width = int(img_width * scale)
-            aspect_ratio = wm_height / wm_width
-            new_wm_height = int(new_wm_width * aspect_ratio)
-            
-            # Resize watermark
-            watermark_img = watermark_img.resize(
-                (new_wm_width, new_wm_height), 
-                Image.LANCZOS
+            new_wm_width = int(img_width * meme_maker_settings.WATERMARK_SCALE)
+            watermark_img = _get_prepared_watermark(
+                found_path, new_wm_width, meme_maker_settings.WATERMARK_OPACITY
             )
             
-            # Apply opacity to watermark
-            if opacity < 1.0:
-                # Adjust alpha channel
-                r, g, b, a = watermark_img.split()
-                a = a.point(lambda x: int(x * opacity))
-                watermark_img = Image.merge('RGBA', (r, g, b, a))
-            
             # Calculate position (bottom-right with padding)
             x = img_width - new_wm_width - padding
-            y = img_height - new_wm_height - padding
+            y = img_height - watermark_img.height - padding
             
             # Composite watermark onto image
             img.paste(watermark_img, (x, y), watermark_img)
@@ -944,43 +1127,64 @@ class Meme(LinkableMixin, RatingMixin, models.Model):
             logger.warning(f"Failed to apply watermark: {e}")
             return img
     
+    # Fields the generated image is rendered from
+    IMAGE_FIELDS = frozenset({'template', 'template_id', 'text_overlays'})
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what the stored image was rendered from, unless either
+        # input was deferred (reading it here would cost a query). The
+        # overlays are kept serialized so in-place edits still re-render.
+        if 'template_id' in field_names and 'text_overlays' in field_names:
+            instance._rendered_from = instance._render_key()
+        return instance
+    
+    def _render_key(self):
+        """Return an immutable snapshot of the inputs the image is rendered from."""
+        return (self.template_id, json.dumps(self.text_overlays))
+    
     def save(self, *args, **kwargs):
         """Override save to generate the composite image."""
-        # First save to get a PK if new
+        # Partial saves that don't touch the template or overlays (ratings,
+        # flags) leave the composite as it is rather than re-rendering it
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self.IMAGE_FIELDS.intersection(update_fields):
+            self._store_generated_image(update_fields, kwargs)
+        
         super().save(*args, **kwargs)
+    
+    def _store_generated_image(self, update_fields, save_kwargs):
+        """
+        Render the composite and point generated_image at it before saving.
         
-        # Generate composite image if overlays exist
-        should_generate = self.get_overlays() and self.get_source_image()
+        The image is stored first so the row is written once, with the
+        generated_image path included, instead of saved and then updated.
+        """
+        # Saving with the same template and overlays keeps the stored image
+        if self.generated_image and getattr(self, '_rendered_from', None) == self._render_key():
+            return
         
-        if should_generate:
-            result = self.generate_image()
-            if result:
-                filename, content = result
-                # Save the generated image directly to storage
-                # and update the field using a direct DB update to avoid recursion
-                from django.core.files.storage import default_storage
-                
-                # Determine the full path
-                upload_path = meme_upload_path(self, filename)
-                
-                # Save to storage
-                saved_path = default_storage.save(upload_path, content)
-                
-                # Update the model field directly in DB
-                Meme.objects.filter(pk=self.pk).update(generated_image=saved_path)
-    
-    def delete(self, *args, **kwargs):
-        """Override delete to also remove image files from storage."""
-        generated_path = self.generated_image.name if self.generated_image else None
+        # Generate composite image if overlays exist
+        if not (self.get_overlays() and self.get_source_image()):
+            return
         
-        super().delete(*args, **kwargs)
+        result = self.generate_image()
+        if not result:
+            return
+        self._rendered_from = self._render_key()
         
-        for path in [generated_path]:
-            if path:
-                try:
-                    default_storage.delete(path)
-                except Exception:
-                    pass
+        filename, content = result
+        old_path = self.generated_image.name if self.generated_image else None
+        # Save the generated image directly to storage
+        self.generated_image = default_storage.save(
+            meme_upload_path(self, filename), content
+        )
+        # The replaced image is removed once the new path is committed
+        if old_path and old_path != self.generated_image.name:
+            transaction.on_commit(functools.partial(delete_stored_file, old_path))
+        if update_fields is not None:
+            save_kwargs['update_fields'] = {*update_fields, 'generated_image'}
 
 
 # =============================================================================
@@ -1055,14 +1259,17 @@ class MemeRating(models.Model):
 
 class TemplateFlag(models.Model):
     """User flag for a meme template."""
+    # Both FKs lead an index below, so neither needs its own
     template = models.ForeignKey(
         MemeTemplate,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='flags'
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='template_flags'
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1071,6 +1278,8 @@ class TemplateFlag(models.Model):
         unique_together = ('template', 'user')
         indexes = [
             models.Index(fields=['created_at']),
+            # Serves the per-user daily flag limit
+            models.Index(fields=['user', 'created_at']),
         ]
 
     def __str__(self):
@@ -1079,14 +1288,17 @@ class TemplateFlag(models.Model):
 
 class MemeFlag(models.Model):
     """User flag for a meme."""
+    # Both FKs lead an index below, so neither needs its own
     meme = models.ForeignKey(
         Meme,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='flags'
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='meme_flags'
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1095,6 +1307,8 @@ class MemeFlag(models.Model):
         unique_together = ('meme', 'user')
         indexes = [
             models.Index(fields=['created_at']),
+            # Serves the per-user daily flag limit
+            models.Index(fields=['user', 'created_at']),
         ]
 
     def __str__(self):
@@ -1127,9 +1341,10 @@ class ExternalSourceQuery(models.Model):
         max_length=300,
         help_text="Original query string",
     )
+    # Looked up together with site_name, which the unique_external_query
+    # constraint's index already covers; no separate index on this column.
     normalized_query = models.CharField(
         max_length=300,
-        db_index=True,
         help_text="Normalized query for cache lookups",
     )
     fetched_at = models.DateTimeField(
@@ -1196,9 +1411,11 @@ class TemplateLink(models.Model):
     content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
+        # Covered by the (content_type, object_id) index below
+        db_index=False,
         help_text="The type of object being linked to"
     )
-    object_id = models.PositiveIntegerField(
+    object_id = models.PositiveBigIntegerField(
         help_text="The ID of the object being linked to"
     )
     linked_object = GenericForeignKey('content_type', 'object_id')
@@ -1226,7 +1443,10 @@ class TemplateLink(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.template.title} → {self.content_type.model}:{self.object_id}"
+        # Content types come from ContentType's per-process cache rather than
+        # an FK fetch per link
+        model = ContentType.objects.get_for_id(self.content_type_id).model
+        return f"{self.template.title} → {model}:{self.object_id}"
 
 
 class MemeLink(models.Model):
@@ -1256,9 +1476,11 @@ class MemeLink(models.Model):
     content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
+        # Covered by the (content_type, object_id) index below
+        db_index=False,
         help_text="The type of object being linked to"
     )
-    object_id = models.PositiveIntegerField(
+    object_id = models.PositiveBigIntegerField(
         help_text="The ID of the object being linked to"
     )
     linked_object = GenericForeignKey('content_type', 'object_id')
@@ -1286,4 +1508,34 @@ class MemeLink(models.Model):
         ]
     
     def __str__(self):
-        return f"Meme #{self.meme.pk} → {self.content_type.model}:{self.object_id}"
+        model = ContentType.objects.get_for_id(self.content_type_id).model
+        return f"Meme #{self.meme_id} → {model}:{self.object_id}"
+
+
+# =============================================================================
+# STORED FILE CLEANUP
+# =============================================================================
+
+def delete_stored_file(path):
+    """Delete path from default storage, ignoring storage errors."""
+    try:
+        default_storage.delete(path)
+    except Exception:
+        pass
+
+
+@receiver(post_delete, sender=MemeTemplate)
+@receiver(post_delete, sender=Meme)
+def _delete_image_files(sender, instance, **kwargs):
+    """
+    Remove a deleted template's or meme's image from storage.
+    
+    Runs for queryset and cascade deletes as well as instance.delete().
+    The file is removed once the transaction commits, so a rolled back
+    delete keeps its image and the storage call happens after the row
+    is gone rather than inside the transaction.
+    """
+    field_name = 'image' if sender is MemeTemplate else 'generated_image'
+    path = getattr(instance, field_name).name
+    if path:
+        transaction.on_commit(functools.partial(delete_stored_file, path))
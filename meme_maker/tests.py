@@ -9,8 +9,9 @@ Or with pytest:
 """
 
 import json
+import shutil
 import tempfile
-from io import BytesIO
+from io import BytesIO, StringIO
 from PIL import Image
 from unittest.mock import patch
 from datetime import timedelta
@@ -25,7 +26,10 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
 
 from .models import MemeTemplate, Meme, TemplateLink, MemeLink, TemplateFlag, MemeFlag, ExternalSourceQuery
-from .forms import MemeTemplateForm, MemeEditorForm, MemeTemplateSearchForm
+from .forms import (
+    MemeTemplateForm, MemeEditorForm, MemeTemplateSearchForm, clean_search_query,
+    OVERLAYS_JSON_MAX_LENGTH,
+)
 
 
 def create_test_image(width=800, height=600, color='red', format='PNG'):
@@ -51,6 +55,24 @@ def linked_object_resolver(request):
     return User.objects.filter(username='linked-resolver').first()
 
 
+# Uploaded and generated images go to a throwaway MEDIA_ROOT instead of the
+# project's media/ directory.
+_media_root = None
+_media_override = None
+
+
+def setUpModule():
+    global _media_root, _media_override
+    _media_root = tempfile.mkdtemp(prefix='meme_maker_tests_')
+    _media_override = override_settings(MEDIA_ROOT=_media_root)
+    _media_override.enable()
+
+
+def tearDownModule():
+    _media_override.disable()
+    shutil.rmtree(_media_root, ignore_errors=True)
+
+
 # =============================================================================
 # MODEL TESTS
 # =============================================================================
@@ -116,6 +138,12 @@ class MemeTemplateModelTest(TestCase):
         results = MemeTemplate.search('FUNNY')
         self.assertIn(self.template, results)
     
+    def test_search_matching_title_and_tags_once(self):
+        """Test a template matching on both title and tags is returned once."""
+        results = MemeTemplate.search('test')
+        self.assertNotIn('DISTINCT', str(results.query))
+        self.assertEqual(list(results), [self.template])
+    
     def test_search_no_results(self):
         """Test search with no matching results."""
         results = MemeTemplate.search('nonexistent')
@@ -233,6 +261,191 @@ class MemeModelTest(TestCase):
         if meme.generated_image:
             self.assertTrue(meme.generated_image.name)
     
+    def test_image_generation_draws_each_line_once(self):
+        """Test text and outline are drawn with one stroked call per line."""
+        from PIL import ImageDraw
+        
+        meme = Meme(template=self.template)
+        meme.set_overlays([
+            {'text': 'Top', 'position': 'top'},
+            {'text': 'Bottom', 'position': 'bottom'},
+        ])
+        with patch.object(ImageDraw.ImageDraw, 'text', autospec=True) as mock_text:
+            self.assertIsNotNone(meme.generate_image())
+        self.assertEqual(mock_text.call_count, 2)
+        for call in mock_text.call_args_list:
+            self.assertGreaterEqual(call.kwargs['stroke_width'], 2)
+            self.assertEqual(call.kwargs['stroke_fill'], '#000000')
+    
+    def test_image_generation_flattens_transparency_onto_white(self):
+        """Test transparent templates are composited onto white for JPEG."""
+        buffer = BytesIO()
+        Image.new('RGBA', (200, 100), (0, 0, 0, 0)).save(buffer, 'PNG')
+        self.template.image = SimpleUploadedFile('clear.png', buffer.getvalue())
+        meme = Meme(template=self.template)
+        meme.set_overlays([{'text': 'Hi', 'position': 'bottom'}])
+        filename, content = meme.generate_image()
+        generated = Image.open(content)
+        self.assertEqual(generated.mode, 'RGB')
+        self.assertGreater(min(generated.getpixel((5, 5))), 245)
+    
+    def test_save_writes_generated_image_with_the_row(self):
+        """Test the generated image path is stored in the same INSERT."""
+        with self.assertNumQueries(1):
+            meme = Meme.objects.create(
+                template=self.template,
+                text_overlays={'overlays': [{'text': 'Once', 'position': 'top'}]},
+            )
+        self.assertTrue(meme.generated_image)
+        meme.refresh_from_db()
+        self.assertTrue(meme.generated_image.name.endswith('.jpg'))
+    
+    def test_deleted_memes_remove_their_image_after_commit(self):
+        """Test queryset deletes clean up generated images once committed."""
+        from django.core.files.storage import default_storage
+        
+        meme = Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Bye', 'position': 'top'}]},
+        )
+        path = meme.generated_image.name
+        self.assertTrue(default_storage.exists(path))
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Meme.objects.filter(pk=meme.pk).delete()
+            self.assertTrue(default_storage.exists(path))
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(default_storage.exists(path))
+    
+    def test_save_without_render_changes_keeps_generated_image(self):
+        """Test saving unchanged overlays doesn't re-render the image."""
+        Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Same', 'position': 'top'}]},
+        )
+        meme = Meme.objects.get()
+        with patch.object(Meme, 'generate_image', return_value=None) as mock_generate:
+            meme.nsfw = True
+            meme.save()
+            mock_generate.assert_not_called()
+            meme.set_overlays([{'text': 'Different', 'position': 'top'}])
+            meme.save()
+            mock_generate.assert_called_once()
+    
+    def test_save_after_in_place_overlay_edit_regenerates_image(self):
+        """Test editing the loaded overlays in place still re-renders the image."""
+        Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Before', 'position': 'top'}]},
+        )
+        meme = Meme.objects.get()
+        old_path = meme.generated_image.name
+        meme.text_overlays['overlays'][0]['text'] = 'After'
+        meme.save()
+        self.assertNotEqual(meme.generated_image.name, old_path)
+    
+    def test_regenerating_removes_replaced_image_after_commit(self):
+        """Test saving new overlays deletes the previous image once committed."""
+        from django.core.files.storage import default_storage
+        
+        meme = Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Old', 'position': 'top'}]},
+        )
+        old_path = meme.generated_image.name
+        with self.captureOnCommitCallbacks(execute=True):
+            meme.set_overlays([{'text': 'New', 'position': 'top'}])
+            meme.save()
+            self.assertTrue(default_storage.exists(old_path))
+        self.assertFalse(default_storage.exists(old_path))
+        self.assertTrue(default_storage.exists(meme.generated_image.name))
+    
+    def test_partial_save_keeps_generated_image(self):
+        """Test rating or flagging a meme doesn't re-render its image."""
+        meme = Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Keep', 'position': 'top'}]},
+        )
+        with patch.object(Meme, 'generate_image', return_value=None) as mock_generate:
+            meme.add_rating(5)
+            meme.flagged = True
+            meme.save(update_fields=['flagged'])
+            mock_generate.assert_not_called()
+            meme.set_overlays([{'text': 'Changed', 'position': 'top'}])
+            meme.save(update_fields=['text_overlays'])
+            mock_generate.assert_called_once()
+    
+    def test_image_generation_wraps_long_text(self):
+        """Test long overlay text is wrapped into lines that fit the image."""
+        from PIL import ImageDraw
+        
+        meme = Meme(template=self.template)
+        meme.set_overlays([{'text': 'many words ' * 8, 'position': 'top'}])
+        with patch.object(ImageDraw.ImageDraw, 'text', autospec=True) as mock_text:
+            self.assertIsNotNone(meme.generate_image())
+        self.assertGreater(mock_text.call_count, 1)
+        font = mock_text.call_args.kwargs['font']
+        for call in mock_text.call_args_list:
+            self.assertLessEqual(font.getlength(call.args[2]), 800 * 0.9)
+    
+    def test_fonts_are_cached_per_font_path_and_size(self):
+        """Test fonts load once per size and follow FONT_PATH overrides."""
+        from .models import BUNDLED_FONT_PATH, load_meme_font
+        
+        self.assertIs(load_meme_font(40), load_meme_font(40))
+        with override_settings(MEME_MAKER={'FONT_PATH': BUNDLED_FONT_PATH}):
+            font = load_meme_font(40)
+            self.assertEqual(font.path, BUNDLED_FONT_PATH)
+            self.assertEqual(font.size, 40)
+    
+    def test_watermark_is_prepared_once_per_width(self):
+        """Test the watermark is loaded and resized once, then reused."""
+        from .models import _get_prepared_watermark, _resolve_watermark_path
+        
+        with tempfile.NamedTemporaryFile(suffix='.png') as watermark_file:
+            Image.new('RGBA', (40, 20), (255, 0, 0, 255)).save(watermark_file, 'PNG')
+            watermark_file.flush()
+            meme = Meme(template=self.template)
+            with override_settings(MEME_MAKER={
+                'WATERMARK_IMAGE': watermark_file.name,
+                'WATERMARK_OPACITY': 0.5,
+                'WATERMARK_SCALE': 0.5,
+            }):
+                with patch('PIL.Image.open', wraps=Image.open) as mock_open:
+                    first = meme._apply_watermark(Image.new('RGB', (200, 100)))
+                    meme._apply_watermark(Image.new('RGB', (200, 100)))
+                self.assertEqual(mock_open.call_count, 1)
+                self.assertEqual(
+                    _resolve_watermark_path(watermark_file.name), watermark_file.name
+                )
+                prepared = _get_prepared_watermark(watermark_file.name, 100, 0.5)
+        self.assertEqual(prepared.size, (100, 50))
+        self.assertEqual(prepared.getpixel((0, 0))[3], 127)
+        self.assertEqual(first.getpixel((189, 89))[0], 127)
+    
+    def test_settings_changes_clear_render_caches(self):
+        """Test overriding render settings drops cached fonts and watermarks."""
+        from .models import _load_font, _watermark_paths, load_meme_font
+        
+        for setting, value in [('MEME_MAKER', {}), ('STATICFILES_DIRS', [])]:
+            load_meme_font(40)
+            _watermark_paths['stale.png'] = '/old/stale.png'
+            with override_settings(**{setting: value}):
+                self.assertEqual(_load_font.cache_info().currsize, 0)
+                self.assertNotIn('stale.png', _watermark_paths)
+    
+    def test_missing_watermark_is_looked_up_again(self):
+        """Test a watermark missing at first render is found once it exists."""
+        import os
+        from .models import _resolve_watermark_path
+        
+        name = 'late-watermark.png'
+        with tempfile.TemporaryDirectory() as tmp_dir, override_settings(BASE_DIR=tmp_dir):
+            with self.assertLogs('meme_maker.models', 'WARNING'):
+                self.assertIsNone(_resolve_watermark_path(name))
+            path = os.path.join(tmp_dir, name)
+            Image.new('RGBA', (10, 10)).save(path, 'PNG')
+            self.assertEqual(_resolve_watermark_path(name), path)
+    
     def test_ordering(self):
         """Test that memes are ordered by created_at descending."""
         meme1 = Meme.objects.create(template=self.template, text_overlays={'overlays': [{'text': 'First', 'position': 'top'}]})
@@ -340,6 +553,45 @@ class MemeEditorFormTest(TestCase):
         self.assertEqual(len(overlays), 1)
         self.assertEqual(overlays[0]['text'], 'JSON Text')
     
+    def test_get_overlays_invalid_json_falls_back(self):
+        """Test that malformed JSON falls back to the simple fields."""
+        form = MemeEditorForm(data={
+            'text_overlays_json': '[{not json',
+            'top_text': 'Fallback',
+        })
+        form.is_valid()
+        
+        overlays = form.get_overlays()
+        self.assertEqual(len(overlays), 1)
+        self.assertEqual(overlays[0]['text'], 'Fallback')
+    
+    def test_get_overlays_oversized_json_falls_back(self):
+        """Test that JSON over the size limit is not used."""
+        json_data = json.dumps([
+            {'text': 'x' * OVERLAYS_JSON_MAX_LENGTH, 'position': 'top'}
+        ])
+        form = MemeEditorForm(data={
+            'text_overlays_json': json_data,
+            'bottom_text': 'Fallback',
+        })
+        form.is_valid()
+        
+        overlays = form.get_overlays()
+        self.assertEqual(len(overlays), 1)
+        self.assertEqual(overlays[0]['position'], 'bottom')
+    
+    def test_get_overlays_parsed_once(self):
+        """Test overlays are built once per form instance."""
+        form = MemeEditorForm(data={
+            'text_overlays_json': json.dumps([{'text': 'Once', 'position': 'top'}])
+        })
+        form.is_valid()
+        
+        with patch('meme_maker.forms._json_loads', wraps=json.loads) as mock_loads:
+            overlays, meta = form.get_overlays_with_meta()
+            self.assertIs(form.get_overlays(), overlays)
+        mock_loads.assert_called_once()
+    
     def test_get_overlays_empty(self):
         """Test getting overlays when no text provided."""
         form = MemeEditorForm(data={
@@ -369,6 +621,12 @@ class MemeTemplateSearchFormTest(TestCase):
         """Test form with no data is valid."""
         form = MemeTemplateSearchForm(data={})
         self.assertTrue(form.is_valid())
+    
+    def test_clean_search_query(self):
+        """Test the query helper strips and caps the raw value."""
+        self.assertEqual(clean_search_query('  funny  '), 'funny')
+        self.assertEqual(clean_search_query(None), '')
+        self.assertEqual(len(clean_search_query('x' * 500)), 200)
 
 
 # =============================================================================
@@ -384,6 +642,7 @@ class HomeViewTest(TestCase):
         self.assertRedirects(response, reverse('meme_maker:template_list'))
 
 
+@override_settings(MEME_MAKER={})
 class TemplateListViewTest(TestCase):
     """Tests for template list view."""
     
@@ -455,6 +714,7 @@ class TemplateListViewTest(TestCase):
         self.assertEqual(len(response.context['templates']), 10)
 
 
+@override_settings(MEME_MAKER={})
 class TemplateDetailViewTest(TestCase):
     """Tests for template detail view."""
     
@@ -512,6 +772,7 @@ class TemplateDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+@override_settings(MEME_MAKER={})
 class TemplateUploadViewTest(TestCase):
     """Tests for template upload view."""
     
@@ -587,6 +848,7 @@ class TemplateDownloadViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+@override_settings(MEME_MAKER={})
 class MemeEditorViewTest(TestCase):
     """Tests for meme editor view."""
     
@@ -657,8 +919,6 @@ class LinkedObjectResolverViewTest(TestCase):
     """Tests for linked object resolver integration."""
 
     def setUp(self):
-        from .conf import meme_maker_settings
-        meme_maker_settings._cached_settings = None
         self.user = User.objects.create_user(username='linked-resolver', password='testpass')
 
     def test_resolver_links_template_upload_and_filters_lists(self):
@@ -689,6 +949,7 @@ class LinkedObjectResolverViewTest(TestCase):
         self.assertIn(linked_meme, memes)
         self.assertNotIn(unlinked_meme, memes)
 
+@override_settings(MEME_MAKER={})
 class MemeDetailViewTest(TestCase):
     """Tests for meme detail view."""
     
@@ -750,6 +1011,7 @@ class MemeDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+@override_settings(MEME_MAKER={})
 class MemeListViewTest(TestCase):
     """Tests for meme list view."""
     
@@ -773,6 +1035,13 @@ class MemeListViewTest(TestCase):
         response = self.client.get(reverse('meme_maker:meme_list'))
         self.assertEqual(response.status_code, 200)
     
+    def test_memes_join_their_template(self):
+        """Test listed memes come with their template already loaded."""
+        response = self.client.get(reverse('meme_maker:meme_list'))
+        memes = list(response.context['memes'])
+        with self.assertNumQueries(0):
+            self.assertEqual({meme.template.title for meme in memes}, {'Test Template'})
+    
     def test_view_uses_correct_template(self):
         """Test correct template is used."""
         response = self.client.get(reverse('meme_maker:meme_list'))
@@ -1039,6 +1308,19 @@ class FlaggingTests(TestCase):
         meme.refresh_from_db()
         self.assertFalse(meme.flagged)
 
+    def test_daily_flag_limit_ignores_earlier_days(self):
+        self.client.login(username='flagger', password='testpass')
+        for idx in range(5):
+            template = MemeTemplate.objects.create(
+                image=get_test_image_file(f'old_flag_{idx}.png'),
+                title=f'Old Flag {idx}'
+            )
+            self.client.post(reverse('meme_maker:flag_template', kwargs={'pk': template.pk}))
+        TemplateFlag.objects.update(created_at=timezone.now() - timedelta(days=1))
+        self.client.post(reverse('meme_maker:flag_meme', kwargs={'pk': self.meme.pk}))
+        self.meme.refresh_from_db()
+        self.assertTrue(self.meme.flagged)
+
 
 class TemplateMemesSortingTests(TestCase):
     """Tests for template meme sorting endpoint."""
@@ -1125,6 +1407,34 @@ class ConfigurationTest(TestCase):
         self.assertEqual(meme_maker_settings.PRIMARY_COLOR, '#667eea')
         self.assertEqual(meme_maker_settings.TITLE, 'Meme Maker')
     
+    def test_settings_are_snapshotted_as_attributes(self):
+        """Test loaded settings live on the instance and follow overrides."""
+        from .conf import meme_maker_settings
+        
+        meme_maker_settings.UPLOAD_PATH
+        self.assertEqual(vars(meme_maker_settings)['WATERMARK_OPACITY'], 0.7)
+        with override_settings(MEME_MAKER={'WATERMARK_OPACITY': 0.5}):
+            self.assertEqual(meme_maker_settings.WATERMARK_OPACITY, 0.5)
+        self.assertEqual(meme_maker_settings.WATERMARK_OPACITY, 0.7)
+    
+    def test_unknown_setting_raises(self):
+        """Test unknown setting names raise AttributeError."""
+        from .conf import meme_maker_settings
+        
+        with self.assertRaises(AttributeError):
+            meme_maker_settings.NOT_A_SETTING
+    
+    def test_linked_object_resolver_imported_once(self):
+        """Test a dotted-path resolver is imported once per settings load."""
+        from .conf import meme_maker_settings
+        
+        with self.settings(MEME_MAKER={'LINKED_OBJECT_RESOLVER': 'meme_maker.tests.linked_object_resolver'}):
+            with patch('meme_maker.conf.import_string', return_value=linked_object_resolver) as mock_import:
+                self.assertIs(meme_maker_settings.get_linked_object_resolver(), linked_object_resolver)
+                self.assertIs(meme_maker_settings.get_linked_object_resolver(), linked_object_resolver)
+            mock_import.assert_called_once()
+        self.assertIsNone(meme_maker_settings.get_linked_object_resolver())
+    
     def test_get_context_returns_dict(self):
         """Test get_context returns all settings as dict."""
         from .conf import meme_maker_settings
@@ -1135,6 +1445,56 @@ class ConfigurationTest(TestCase):
         self.assertIn('meme_maker_title', context)
         self.assertIn('meme_maker_primary_color', context)
 
+    def test_app_config_settings_are_cached(self):
+        """Test MemeMakerConfig returns the same read-only settings mapping."""
+        from .apps import MemeMakerConfig
+
+        first = MemeMakerConfig.get_all_settings()
+        self.assertIs(first, MemeMakerConfig.get_all_settings())
+        with self.assertRaises(TypeError):
+            first['title'] = 'Changed'
+
+    def test_app_config_settings_follow_overrides(self):
+        """Test overriding MEME_MAKER invalidates the cached settings."""
+        from .apps import MemeMakerConfig
+
+        with override_settings(MEME_MAKER={'TITLE': 'Overridden'}):
+            self.assertEqual(MemeMakerConfig.get_title(), 'Overridden')
+            self.assertEqual(MemeMakerConfig.get_all_settings()['title'], 'Overridden')
+            self.assertEqual(MemeMakerConfig.get_upload_path(), 'memes/')
+        self.assertEqual(MemeMakerConfig.get_title(), 'Meme Maker')
+
+    def test_get_setting_reads_shared_snapshot(self):
+        """Test get_setting serves known keys from meme_maker_settings."""
+        from .conf import get_setting, meme_maker_settings
+
+        with override_settings(MEME_MAKER={'TITLE': 'Shared', 'EXTRA': 1}):
+            self.assertEqual(get_setting('TITLE'), meme_maker_settings.TITLE)
+            self.assertEqual(get_setting('TITLE'), 'Shared')
+            self.assertEqual(get_setting('EXTRA'), 1)
+            self.assertEqual(get_setting('MISSING', 'fallback'), 'fallback')
+
+    def test_get_setting_returns_default_for_unset_known_keys(self):
+        """Test get_setting honours the caller's default for unset known keys."""
+        from .conf import get_setting
+
+        with override_settings(MEME_MAKER={}):
+            self.assertEqual(get_setting('TITLE', 'fallback'), 'fallback')
+            self.assertIsNone(get_setting('UPLOAD_PATH'))
+
+    def test_app_settings_are_frozen(self):
+        """Test the resolved AppSettings cannot be modified."""
+        from dataclasses import FrozenInstanceError
+        from .conf import get_app_settings
+
+        app_settings = get_app_settings()
+        self.assertIs(app_settings, get_app_settings())
+        self.assertEqual(app_settings.primary_color, '#667eea')
+        with self.assertRaises(FrozenInstanceError):
+            app_settings.title = 'Changed'
+        with override_settings(MEME_MAKER={'SHOW_NAV': False}):
+            self.assertFalse(get_app_settings().show_nav)
+
 
 class ContextProcessorTest(TestCase):
     """Tests for the context processor."""
@@ -1147,6 +1507,21 @@ class ContextProcessorTest(TestCase):
         self.assertIn('meme_maker_title', response.context)
         self.assertIn('meme_maker_primary_color', response.context)
 
+    def test_context_processor_reuses_dict(self):
+        """Test the context processor builds its dict once."""
+        from .context_processors import meme_maker_context
+
+        self.assertIs(meme_maker_context(None), meme_maker_context(None))
+
+    def test_context_processor_follows_overrides(self):
+        """Test overriding MEME_MAKER rebuilds the cached context."""
+        from .context_processors import meme_maker_context
+
+        meme_maker_context(None)
+        with override_settings(MEME_MAKER={'TITLE': 'Overridden'}):
+            self.assertEqual(meme_maker_context(None)['meme_maker_title'], 'Overridden')
+        self.assertEqual(meme_maker_context(None)['meme_maker_title'], 'Meme Maker')
+
 
 # =============================================================================
 # EDGE CASE TESTS
@@ -1282,6 +1657,34 @@ class RatingMixinTest(TestCase):
         self.assertEqual(template.rating_sum, 5)
         self.assertEqual(template.get_average_rating(), 5.0)
     
+    def test_stored_average_rating_follows_ratings(self):
+        """Test avg_rating is saved with each rating and used for sorting."""
+        template = MemeTemplate.objects.create(
+            image=get_test_image_file('test.png'),
+            title='Rating Test'
+        )
+        template.add_rating(2)
+        template.add_rating(5)
+        template.update_rating(old_stars=2, new_stars=4)
+        template.refresh_from_db()
+        self.assertEqual(template.avg_rating, 4.5)
+        
+        results = MemeTemplate.search('', order_by='-rating')
+        self.assertNotIn('CAST', str(results.query))
+        self.assertEqual(results.first(), template)
+    
+    def test_ratings_from_stale_instances_are_not_lost(self):
+        """Test ratings are applied atomically in the database."""
+        template = MemeTemplate.objects.create(
+            image=get_test_image_file('test.png'),
+            title='Rating Test'
+        )
+        stale = MemeTemplate.objects.get(pk=template.pk)
+        template.add_rating(5)
+        self.assertEqual(stale.add_rating(1), 3.0)
+        self.assertEqual((stale.rating_sum, stale.rating_count), (6, 2))
+        self.assertEqual(stale.avg_rating, 3.0)
+    
     def test_rating_display_no_ratings(self):
         """Test rating display with no ratings."""
         template = MemeTemplate.objects.create(
@@ -1624,6 +2027,25 @@ class TemplateLinkingTests(TestCase):
         self.assertIn(self.user1, linked_objects)
         self.assertIn(self.user2, linked_objects)
     
+    def test_bulk_link_to(self):
+        """Test linking to several objects at once skips existing links."""
+        self.template.link_to(self.user1, link_type='original')
+        
+        self.template.bulk_link_to([self.user1, self.user2], link_type='bulk')
+        
+        self.assertEqual(self.template.object_links.count(), 2)
+        self.assertTrue(self.template.is_linked_to(self.user2))
+        self.assertEqual(self.template.get_links(User).get(object_id=self.user1.pk).link_type, 'original')
+    
+    def test_bulk_link_to_in_batches(self):
+        """Test bulk_link_to splits long lists into batch_size INSERTs."""
+        ContentType.objects.get_for_model(User)  # warm the content type cache
+        extra = User.objects.create_user(username='third')
+        
+        with self.assertNumQueries(2):
+            self.template.bulk_link_to([self.user1, self.user2, extra], batch_size=2)
+        self.assertEqual(self.template.object_links.count(), 3)
+    
     def test_link_to_same_object_twice(self):
         """Test that linking to the same object twice doesn't create duplicates."""
         link1 = self.template.link_to(self.user1)
@@ -1656,6 +2078,61 @@ class TemplateLinkingTests(TestCase):
         result = self.template.unlink_from(self.user1)
         self.assertFalse(result)
     
+    def test_link_to_object_with_64_bit_pk(self):
+        """Test linking to objects whose pk exceeds a 32-bit integer."""
+        big_user = User.objects.create_user(pk=2 ** 40, username='big-pk')
+        self.template.link_to(big_user)
+        self.assertTrue(self.template.is_linked_to(big_user))
+        self.assertEqual(self.template.get_linked_objects(User), [big_user])
+    
+    def test_with_links_prefetches_linked_objects(self):
+        """Test with_links() loads links and targets for many instances at once."""
+        other = MemeTemplate.objects.create(
+            image=get_test_image_file('other.png'),
+            title='Other Template'
+        )
+        self.template.link_to(self.user1)
+        other.link_to(self.user2)
+        other.link_to(self.template)
+        ContentType.objects.get_for_model(User)  # warm the content type cache
+        ContentType.objects.get_for_model(MemeTemplate)
+        
+        with self.assertNumQueries(4):
+            templates = {t.pk: t for t in MemeTemplate.objects.with_links()}
+        with self.assertNumQueries(0):
+            self.assertEqual(templates[self.template.pk].get_linked_objects(), [self.user1])
+            self.assertEqual(templates[other.pk].get_linked_objects(User), [self.user2])
+    
+    def test_get_linked_objects_queries_per_content_type(self):
+        """Test linked objects resolve in one query per content type."""
+        self.template.link_to(self.user1)
+        self.template.link_to(self.user2)
+        ContentType.objects.get_for_model(User)  # warm the content type cache
+        
+        with self.assertNumQueries(2):
+            linked_objects = self.template.get_linked_objects()
+        self.assertEqual(len(linked_objects), 2)
+    
+    def test_get_linked_objects_ignores_default_manager_filtering(self):
+        """Test links resolve even when the target's default manager hides rows."""
+        from django.contrib.auth.models import UserManager
+        
+        class ActiveUserManager(UserManager):
+            def get_queryset(self):
+                return super().get_queryset().filter(is_active=True)
+        
+        active_users = ActiveUserManager()
+        active_users.model = User
+        self.user1.is_active = False
+        self.user1.save()
+        self.template.link_to(self.user1)
+        
+        with patch.object(User._meta, 'default_manager', active_users):
+            self.assertFalse(User._default_manager.filter(pk=self.user1.pk).exists())
+            self.assertEqual(self.template.get_linked_objects(), [self.user1])
+            prefetched = MemeTemplate.objects.with_links().get(pk=self.template.pk)
+            self.assertEqual(prefetched.get_linked_objects(), [self.user1])
+    
     def test_get_linked_objects_filtered_by_type(self):
         """Test getting linked objects filtered by model type."""
         # Create another template to link to (different model type)
@@ -1732,6 +2209,14 @@ class MemeLinkingTests(TestCase):
         self.user1 = User.objects.create_user(username='memeuser1', password='testpass')
         self.user2 = User.objects.create_user(username='memeuser2', password='testpass')
     
+    def test_link_str_uses_cached_content_type(self):
+        """Test MemeLink.__str__ needs no queries once content types are cached."""
+        self.meme.link_to(self.user1)
+        ContentType.objects.get_for_model(User)  # warm the content type cache
+        link = MemeLink.objects.get()
+        with self.assertNumQueries(0):
+            self.assertEqual(str(link), f"Meme #{self.meme.pk} → user:{self.user1.pk}")
+    
     def test_link_meme_to_object(self):
         """Test linking a meme to an object."""
         link = self.meme.link_to(self.user1)
@@ -1779,6 +2264,15 @@ class MemeLinkingTests(TestCase):
         self.assertEqual(memes_for_user1.count(), 1)
         self.assertEqual(memes_for_user1.first(), self.meme)
     
+    def test_linked_to_chains_as_join(self):
+        """Test linked_to chains on querysets and joins instead of subquerying."""
+        self.meme.link_to(self.user1)
+        
+        memes = self.template.memes.filter(flagged=False).linked_to(self.user1)
+        self.assertEqual(list(memes), [self.meme])
+        self.assertNotIn('IN (SELECT', str(memes.query).upper())
+        self.assertFalse(self.template.memes.linked_to(self.user2).exists())
+    
     def test_link_with_metadata(self):
         """Test linking with additional metadata."""
         metadata = {'context': 'marketing', 'campaign_id': 123}
@@ -1843,15 +2337,33 @@ class LinkCascadeDeleteTests(TestCase):
 # =============================================================================
 
 class ImgflipSearchTests(TestCase):
-    def setUp(self):
-        from .conf import meme_maker_settings
-        meme_maker_settings._cached_settings = None
+    def test_normalize_external_query(self):
+        from .views import normalize_external_query
+        self.assertEqual(normalize_external_query('  Drake\t\n Hotline  BLING '), 'drake hotline bling')
+        self.assertEqual(normalize_external_query(None), '')
+
+    def test_prune_external_cache_deletes_stale_entries(self):
+        from django.core.management import call_command
+        now = timezone.now()
+        for query, age in (('old', 40), ('fresh', 1)):
+            ExternalSourceQuery.objects.create(
+                site_name=ExternalSourceQuery.SITE_IMGFLIP,
+                query_str=query,
+                normalized_query=query,
+                fetched_at=now - timedelta(days=age),
+            )
+        out = StringIO()
+        with override_settings(MEME_MAKER={'IMGFLIP_CACHE_DAYS': 30}):
+            call_command('prune_external_cache', stdout=out)
+        self.assertIn('Deleted 1 cached query.', out.getvalue())
+        self.assertEqual(
+            list(ExternalSourceQuery.objects.values_list('normalized_query', flat=True)),
+            ['fresh'],
+        )
 
     @patch('meme_maker.views.requests.post')
     def test_imgflip_disabled_returns_unavailable(self, mock_post):
         with override_settings(MEME_MAKER={'ENABLE_IMGFLIP_SEARCH': False}):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             response = self.client.get(reverse('meme_maker:imgflip_search'), {'q': 'drake'})
             self.assertContains(response, 'Imgflip search unavailable')
             mock_post.assert_not_called()
@@ -1864,8 +2376,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_PASSWORD': 'pass',
             'IMGFLIP_CACHE_DAYS': 30,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             from .views import build_imgflip_cache_key, normalize_external_query
             normalized = normalize_external_query('drake')
             max_len = ExternalSourceQuery._meta.get_field('normalized_query').max_length
@@ -1906,8 +2416,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_PASSWORD': 'pass',
             'IMGFLIP_CACHE_DAYS': 30,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             from .views import build_imgflip_cache_key, normalize_external_query
             normalized = normalize_external_query('drake')
             max_len = ExternalSourceQuery._meta.get_field('normalized_query').max_length
@@ -1961,8 +2469,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_CACHE_DAYS': 30,
             'IMGFLIP_ERROR_CACHE_MINUTES': 30,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             from .views import build_imgflip_cache_key, normalize_external_query
             normalized = normalize_external_query('drake')
             max_len = ExternalSourceQuery._meta.get_field('normalized_query').max_length
@@ -1991,9 +2497,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_PASSWORD': 'pass',
             'IMGFLIP_CACHE_DAYS': 30,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
-
             class DummyResponse:
                 def json(self):
                     return {
@@ -2031,8 +2534,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_PASSWORD': 'pass',
             'IMGFLIP_CACHE_DAYS': 0,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             from .views import build_imgflip_cache_key, normalize_external_query
 
             normalized = normalize_external_query('drake')
@@ -2086,8 +2587,6 @@ class ImgflipSearchTests(TestCase):
             'IMGFLIP_CACHE_DAYS': 30,
             'IMGFLIP_ERROR_CACHE_MINUTES': 1,
         }):
-            from .conf import meme_maker_settings
-            meme_maker_settings._cached_settings = None
             from .views import build_imgflip_cache_key, normalize_external_query
 
             normalized = normalize_external_query('drake')
@@ -2131,3 +2630,232 @@ class ImgflipSearchTests(TestCase):
                 normalized_query=cache_key,
             )
             self.assertEqual(cached.status, ExternalSourceQuery.STATUS_SUCCESS)
+
+
+# =============================================================================
+# ADMIN TESTS
+# =============================================================================
+
+class AdminTests(TestCase):
+    """Tests for the admin interfaces."""
+
+    def setUp(self):
+        from django.contrib.admin.sites import site
+        from django.test import RequestFactory
+        from .admin import PopularTemplateFilter
+
+        PopularTemplateFilter._lookups_cache.clear()
+        self.site = site
+        self.request = RequestFactory().get('/admin/')
+        self.request.user = User.objects.create_superuser('admin', 'admin@example.com', 'pass')
+        self.template = MemeTemplate.objects.create(
+            image=get_test_image_file('admin.png'),
+            title='Admin Template',
+        )
+        Meme.objects.create(template=self.template)
+        Meme.objects.create(template=self.template)
+
+    def test_template_admin_annotates_meme_count(self):
+        """Test meme_count comes from the annotated queryset."""
+        model_admin = self.site._registry[MemeTemplate]
+        template = model_admin.get_queryset(self.request).get(pk=self.template.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(model_admin.meme_count(template), 2)
+
+    def test_external_query_admin_defers_result_payload(self):
+        """Test the cache changelist doesn't load API payloads."""
+        model_admin = self.site._registry[ExternalSourceQuery]
+        ExternalSourceQuery.objects.create(
+            site_name=ExternalSourceQuery.SITE_IMGFLIP,
+            query_str='cat',
+            normalized_query='cat',
+            result_json={'data': {'memes': []}},
+        )
+        entry = model_admin.get_queryset(self.request).get()
+        self.assertIn('result_json', entry.get_deferred_fields())
+        self.assertEqual(entry.result_json, {'data': {'memes': []}})
+
+    def test_regenerate_images_action(self):
+        """Test the regenerate action replaces the images and bumps updated_at."""
+        from django.core.files.storage import default_storage
+
+        meme = Meme.objects.create(
+            template=self.template,
+            text_overlays={'overlays': [{'text': 'Again', 'position': 'top'}]},
+        )
+        meme.refresh_from_db()
+        old_name = meme.generated_image.name
+        old_updated_at = meme.updated_at
+        self.client.force_login(self.request.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('admin:meme_maker_meme_changelist'),
+                {'action': 'regenerate_images', '_selected_action': [meme.pk]},
+                follow=True,
+            )
+        self.assertContains(response, 'Successfully regenerated 1 of 1 meme images.')
+        meme.refresh_from_db()
+        self.assertTrue(meme.generated_image)
+        self.assertNotEqual(meme.generated_image.name, old_name)
+        self.assertGreater(meme.updated_at, old_updated_at)
+        self.assertFalse(default_storage.exists(old_name))
+        self.assertTrue(default_storage.exists(meme.generated_image.name))
+
+    def test_meme_change_view_renders(self):
+        """Test the meme change page renders with the current fields."""
+        meme = Meme.objects.filter(template=self.template).first()
+        self.client.force_login(self.request.user)
+        response = self.client.get(reverse('admin:meme_maker_meme_change', args=[meme.pk]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_image_preview_markup(self):
+        """Test preview columns render an escaped <img> tag."""
+        model_admin = self.site._registry[MemeTemplate]
+        html = model_admin.image_preview(self.template)
+        self.assertTrue(html.startswith(f'<img src="{self.template.image.url}"'))
+        self.assertIn('max-height: 50px', html)
+        self.assertIn('loading="lazy"', html)
+        from django.utils.html import format_html
+        self.assertEqual(
+            model_admin.image_preview_large(self.template),
+            format_html(
+                '<img src="{}" loading="lazy" decoding="async" '
+                'style="max-height: 300px; max-width: 100%; object-fit: contain; border-radius: 8px;">',
+                self.template.image.url,
+            ),
+        )
+
+    def test_meme_changelist_queries_do_not_scale_with_rows(self):
+        """Test the meme changelist joins templates instead of querying per row."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .admin import PopularTemplateFilter
+
+        self.client.force_login(self.request.user)
+        url = reverse('admin:meme_maker_meme_changelist')
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+        for i in range(5):
+            other = MemeTemplate.objects.create(
+                image=get_test_image_file(f'admin{i}.png', width=20, height=20),
+                title=f'Other {i}',
+            )
+            Meme.objects.create(template=other)
+        PopularTemplateFilter._lookups_cache.clear()
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+    def test_meme_preview_falls_back_to_template_image(self):
+        """Test meme previews use the source image when nothing is generated."""
+        model_admin = self.site._registry[Meme]
+        meme = Meme.objects.filter(template=self.template).first()
+        self.assertFalse(meme.generated_image)
+        self.assertIn(self.template.image.url, model_admin.meme_preview(meme))
+        self.assertEqual(model_admin.meme_preview(Meme()), '-')
+
+    def test_popular_template_filter(self):
+        """Test the template filter lists popular templates and still filters by pk."""
+        from .admin import PopularTemplateFilter
+
+        unused = MemeTemplate.objects.create(
+            image=get_test_image_file('unused.png', width=20, height=20),
+            title='Unused',
+        )
+        self.client.force_login(self.request.user)
+        url = reverse('admin:meme_maker_meme_changelist')
+        with patch.object(PopularTemplateFilter, 'limit', 1):
+            response = self.client.get(url)
+        self.assertContains(response, 'Admin Template')
+        self.assertNotContains(response, 'Unused')
+
+        response = self.client.get(url, {'template': unused.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 0)
+
+    def test_popular_template_filter_caches_lookups(self):
+        """Test the template ranking isn't recomputed on every changelist load."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .admin import PopularTemplateFilter
+        
+        self.client.force_login(self.request.user)
+        url = reverse('admin:meme_maker_meme_changelist')
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(url)
+        self.assertContains(response, 'Admin Template')
+        self.assertEqual(len(second.captured_queries), len(first.captured_queries) - 1)
+        
+        with patch.object(PopularTemplateFilter, 'cache_seconds', -1):
+            self.client.get(url)
+            with CaptureQueriesContext(connection) as expired:
+                self.client.get(url)
+        self.assertEqual(len(expired.captured_queries), len(first.captured_queries))
+    
+    def test_popular_template_filter_rejects_invalid_value(self):
+        """Test a non-numeric template filter value redirects instead of erroring."""
+        self.client.force_login(self.request.user)
+        url = reverse('admin:meme_maker_meme_changelist')
+        response = self.client.get(url, {'template': 'abc'})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('e=1', response['Location'])
+
+    def test_flag_and_link_changelists_do_not_scale_with_rows(self):
+        """Test meme flag/link changelists join the meme's template."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_login(self.request.user)
+        urls = [
+            reverse('admin:meme_maker_memeflag_changelist'),
+            reverse('admin:meme_maker_memelink_changelist'),
+        ]
+
+        def add_rows(prefix):
+            for i in range(3):
+                user = User.objects.create_user(username=f'{prefix}flagger{i}', password='pass')
+                other = MemeTemplate.objects.create(
+                    image=get_test_image_file(f'{prefix}flag{i}.png', width=20, height=20),
+                    title=f'Flagged {prefix}{i}',
+                )
+                meme = Meme.objects.create(template=other)
+                MemeFlag.objects.create(meme=meme, user=user)
+                meme.link_to(user)
+
+        add_rows('a')
+        for n, url in enumerate(urls):
+            with CaptureQueriesContext(connection) as few:
+                self.client.get(url)
+            add_rows(f'b{n}')
+            with CaptureQueriesContext(connection) as many:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(many.captured_queries), len(few.captured_queries), url)
+
+
+# =============================================================================
+# PACKAGE TESTS
+# =============================================================================
+
+class PackageLazyImportTests(TestCase):
+    """Tests for the lazy attributes on the meme_maker package."""
+
+    def test_lazy_attributes_resolve(self):
+        """Test package attributes resolve to the real objects."""
+        import meme_maker
+        from .conf import meme_maker_settings
+
+        self.assertIs(meme_maker.Meme, Meme)
+        self.assertIs(meme_maker.MemeEditorForm, MemeEditorForm)
+        self.assertIs(meme_maker.meme_maker_settings, meme_maker_settings)
+        self.assertIn('Meme', vars(meme_maker))
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        import meme_maker
+
+        with self.assertRaises(AttributeError):
+            meme_maker.DoesNotExist
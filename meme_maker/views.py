@@ -10,7 +10,6 @@ Provides views for:
 
 import json
 import mimetypes
-import re
 import hashlib
 from datetime import timedelta
 import requests
@@ -21,14 +20,13 @@ from django.contrib.auth.decorators import login_required
 from django.views.generic import CreateView, DetailView, ListView
 from django.views.decorators.http import require_POST, require_GET
 from django.core.files.storage import default_storage
-from django.core.exceptions import ImproperlyConfigured
-from django.utils.module_loading import import_string
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db import IntegrityError
 
 from .models import Meme, MemeTemplate, TemplateRating, MemeRating, MemeFlag, TemplateFlag, ExternalSourceQuery
-from .forms import MemeTemplateForm, MemeTemplateSearchForm, MemeEditorForm
+from .forms import MemeTemplateForm, MemeTemplateSearchForm, MemeEditorForm, clean_search_query
 from .conf import meme_maker_settings
 
 
@@ -40,16 +38,10 @@ def resolve_linked_object(request):
     """Resolve a linked object for scoping templates/memes, if configured."""
     if hasattr(request, '_meme_maker_linked_object'):
         return request._meme_maker_linked_object
-    resolver = meme_maker_settings.LINKED_OBJECT_RESOLVER
-    if not resolver:
+    resolver = meme_maker_settings.get_linked_object_resolver()
+    if resolver is None:
         request._meme_maker_linked_object = None
         return None
-    if isinstance(resolver, str):
-        resolver = import_string(resolver)
-    if not callable(resolver):
-        raise ImproperlyConfigured(
-            "MEME_MAKER['LINKED_OBJECT_RESOLVER'] must be a callable or dotted path."
-        )
     request._meme_maker_linked_object = resolver(request)
     return request._meme_maker_linked_object
 
@@ -83,8 +75,9 @@ def get_template_candidates(template_name):
 
 def normalize_external_query(query):
     """Normalize external search query for caching."""
-    normalized = re.sub(r'\s+', ' ', (query or '')).strip().lower()
-    return normalized
+    # str.split() with no argument splits on the same characters as \s and
+    # drops leading/trailing runs, so this collapses and trims in one pass.
+    return ' '.join((query or '').split()).lower()
 
 
 def truncate_query_value(value, max_len):
@@ -136,9 +129,7 @@ def extract_imgflip_memes(result_json):
 def get_template_memes_queryset(template, linked_obj=None):
     qs = template.memes.filter(flagged=False)
     if linked_obj:
-        qs = qs.filter(
-            pk__in=Meme.objects.linked_to(linked_obj).values_list('pk', flat=True)
-        )
+        qs = qs.linked_to(linked_obj)
     return qs
 
 
@@ -147,16 +138,6 @@ def apply_template_memes_sort(qs, sort_key):
     if sort_key == 'random':
         return qs.order_by('?'), sort_key
 
-    from django.db.models import Case, When, F, FloatField, Value
-    from django.db.models.functions import Cast
-    qs = qs.annotate(
-        avg_rating=Case(
-            When(rating_count=0, then=Value(0.0)),
-            default=Cast(F('rating_sum'), FloatField()) / Cast(F('rating_count'), FloatField()),
-            output_field=FloatField()
-        )
-    )
-
     if sort_key == 'best':
         qs = qs.filter(rating_count__gte=5).order_by('-avg_rating', '-rating_count', '-created_at')
     elif sort_key == 'popular':
@@ -193,8 +174,7 @@ def template_list(request):
     Shows a grid of available templates.
     Supports ordering by rating, date, or title.
     """
-    form = MemeTemplateSearchForm(request.GET)
-    query = request.GET.get('q', '').strip()
+    query = clean_search_query(request.GET.get('q'))
     order_by = request.GET.get('order', '-created')  # Default: newest first
     per_page = get_per_page(request, default=25)
     
@@ -210,8 +190,7 @@ def template_list(request):
     )
     linked_obj = resolve_linked_object(request)
     if linked_obj:
-        linked_ids = MemeTemplate.objects.linked_to(linked_obj).values_list('pk', flat=True)
-        templates = templates.filter(pk__in=linked_ids)
+        templates = templates.linked_to(linked_obj)
 
     paginator = Paginator(templates, per_page)
     page_number = request.GET.get('page', 1)
@@ -229,7 +208,8 @@ def template_list(request):
         'page_obj': page_obj,
         'is_paginated': paginator.num_pages > 1,
         'total_count': paginator.count,
-        'search_form': form,
+        # Only built if a template renders it
+        'search_form': SimpleLazyObject(lambda: MemeTemplateSearchForm(request.GET)),
         'query': query,
         'order_by': order_by,
         'per_page': per_page,
@@ -618,24 +598,14 @@ def meme_list(request):
         memes = Meme.objects.linked_to(linked_obj)
     else:
         memes = Meme.objects.all()
-    memes = memes.filter(flagged=False)
+    # Cards show the template's image and title
+    memes = memes.filter(flagged=False).select_related('template')
     
     # Apply ordering
-    if order_by == 'rating' or order_by == '-rating':
-        from django.db.models import Case, When, F, FloatField, Value
-        from django.db.models.functions import Cast
-        
-        memes = memes.annotate(
-            avg_rating=Case(
-                When(rating_count=0, then=Value(0.0)),
-                default=Cast(F('rating_sum'), FloatField()) / Cast(F('rating_count'), FloatField()),
-                output_field=FloatField()
-            )
-        )
-        if order_by == '-rating':
-            memes = memes.order_by('-avg_rating', '-rating_count', '-created_at')
-        else:
-            memes = memes.order_by('avg_rating', 'rating_count', 'created_at')
+    if order_by == '-rating':
+        memes = memes.order_by('-avg_rating', '-rating_count', '-created_at')
+    elif order_by == 'rating':
+        memes = memes.order_by('avg_rating', 'rating_count', 'created_at')
     elif order_by == 'created':
         memes = memes.order_by('created_at')
     else:  # -created
@@ -715,10 +685,16 @@ def _ensure_session(request):
 
 
 def _user_flag_count_today(user):
-    today = timezone.localdate()
+    # Compare against the start of the local day rather than using
+    # created_at__date, which wraps the column in a cast and keeps the
+    # (user, created_at) index from being used for the range.
+    now = timezone.now()
+    if timezone.is_aware(now):
+        now = timezone.localtime(now)
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
     return (
-        TemplateFlag.objects.filter(user=user, created_at__date=today).count() +
-        MemeFlag.objects.filter(user=user, created_at__date=today).count()
+        TemplateFlag.objects.filter(user=user, created_at__gte=start_of_day).count() +
+        MemeFlag.objects.filter(user=user, created_at__gte=start_of_day).count()
     )
 
 
@@ -885,7 +861,7 @@ class MemeTemplateListView(ListView):
         return get_per_page(self.request, default=self.paginate_by)
     
     def get_queryset(self):
-        query = self.request.GET.get('q', '').strip()
+        query = clean_search_query(self.request.GET.get('q'))
         if query:
             qs = MemeTemplate.search(query)
         else:
@@ -893,14 +869,13 @@ class MemeTemplateListView(ListView):
         qs = qs.filter(flagged=False)
         linked_obj = resolve_linked_object(self.request)
         if linked_obj:
-            linked_ids = MemeTemplate.objects.linked_to(linked_obj).values_list('pk', flat=True)
-            qs = qs.filter(pk__in=linked_ids)
+            qs = qs.linked_to(linked_obj)
         return qs
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_form'] = MemeTemplateSearchForm(self.request.GET)
-        context['query'] = self.request.GET.get('q', '')
+        context['search_form'] = SimpleLazyObject(lambda: MemeTemplateSearchForm(self.request.GET))
+        context['query'] = clean_search_query(self.request.GET.get('q'))
         context['title'] = 'Template Bank'
         context['page_type'] = 'template_list'
         context['per_page'] = self.get_paginate_by(self.get_queryset())
@@ -932,9 +907,7 @@ class MemeTemplateDetailView(DetailView):
             raise Http404
         recent_memes = self.object.memes.filter(flagged=False)
         if linked_obj:
-            recent_memes = recent_memes.filter(
-                pk__in=Meme.objects.linked_to(linked_obj).values_list('pk', flat=True)
-            )
+            recent_memes = recent_memes.linked_to(linked_obj)
         context['recent_memes'] = recent_memes[:6]
         context['title'] = self.object.title
         context['page_type'] = 'template_detail'
@@ -1011,7 +984,7 @@ class MemeListView(ListView):
             qs = Meme.objects.linked_to(linked_obj)
         else:
             qs = Meme.objects.all()
-        return qs.filter(flagged=False)
+        return qs.filter(flagged=False).select_related('template')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)